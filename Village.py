@@ -1,7 +1,11 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
+from tkinter import font as tkfont
 import sqlite3
 import hashlib
+import io
+import re
+import bisect
 from datetime import datetime, timedelta
 import time
 import csv
@@ -9,10 +13,27 @@ import os
 import json
 import logging
 from typing import Dict, List, Tuple, Optional, Any
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
 import threading
 
+# Compiled once at import; email validation runs on every form submit
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# Bound-method formatters for the row-rendering hot loops; an f-string
+# re-parses its format spec on every evaluation
+_fmt_mwk = "MWK {:,.2f}".format
+_fmt_pct = "{:.1f}%".format
+
+# Shared worker pool for database calls made from dialogs, so the Tk
+# main thread never blocks on disk or network I/O; threads are only
+# spawned on first submit
+_db_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='db-worker')
+
 # Custom Exception Classes for User-Friendly Error Handling
 class BankMmudziException(Exception):
     """Base exception class for Bank Mmudzi application"""
@@ -187,12 +208,25 @@ class ErrorHandler:
         except Exception as e:
             return ErrorHandler.handle_error(e, "validation")
 
+# Detect tkcalendar without importing it (and its babel dependency) at
+# startup; the Calendar widget itself is only imported where it is used
+import importlib.util
+TKCALENDAR_AVAILABLE = importlib.util.find_spec('tkcalendar') is not None
+if not TKCALENDAR_AVAILABLE:
+    print("tkcalendar not available. Install with: pip install tkcalendar")
+
 try:
-    from tkcalendar import Calendar
-    TKCALENDAR_AVAILABLE = True
+    import numpy as np
+    NUMPY_AVAILABLE = True
 except ImportError:
-    TKCALENDAR_AVAILABLE = False
-    print("tkcalendar not available. Install with: pip install tkcalendar")
+    NUMPY_AVAILABLE = False
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
 
 try:
     import mysql.connector
@@ -201,24 +235,16 @@ except ImportError:
     MYSQL_AVAILABLE = False
     print("MySQL connector not available. Install with: pip install mysql-connector-python")
 
-# Additional imports for enhanced functionality
-try:
-    from reportlab.lib.pagesizes import letter, A4
-    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.units import inch
-    from reportlab.lib import colors
-    REPORTLAB_AVAILABLE = True
-except ImportError:
-    REPORTLAB_AVAILABLE = False
+# Additional imports for enhanced functionality. ReportLab and OpenPyXL
+# are sizable packages used only by the export paths, so startup just
+# probes for them; the real imports happen inside the exporters on
+# first use
+REPORTLAB_AVAILABLE = importlib.util.find_spec('reportlab') is not None
+if not REPORTLAB_AVAILABLE:
     print("ReportLab not available. Install with: pip install reportlab for PDF export")
 
-try:
-    import openpyxl
-    from openpyxl.styles import Font, Alignment, PatternFill
-    OPENPYXL_AVAILABLE = True
-except ImportError:
-    OPENPYXL_AVAILABLE = False
+OPENPYXL_AVAILABLE = importlib.util.find_spec('openpyxl') is not None
+if not OPENPYXL_AVAILABLE:
     print("OpenPyXL not available. Install with: pip install openpyxl for Excel export")
 
 # Configure logging
@@ -873,26 +899,24 @@ class EnhancedReportGenerator:
             conn = connect_db()
             cursor = conn.cursor()
             
-            # Total members
-            cursor.execute("SELECT COUNT(*) FROM Members WHERE status = 'active'")
-            total_members = cursor.fetchone()[0]
-            
-            # Total contributions
-            cursor.execute("SELECT COALESCE(SUM(amount), 0) FROM Contributions WHERE contribution_date <= ?", (end_date,))
-            total_contributions = cursor.fetchone()[0]
-            
-            # Total loans disbursed
-            cursor.execute("SELECT COALESCE(SUM(loan_amount), 0) FROM Loans WHERE loan_date <= ?", (end_date,))
-            total_loans_disbursed = cursor.fetchone()[0]
-            
-            # Total repayments
-            cursor.execute("SELECT COALESCE(SUM(repayment_amount), 0) FROM Repayments WHERE repayment_date <= ?", (end_date,))
-            total_repayments = cursor.fetchone()[0]
-            
-            # Outstanding loans
-            cursor.execute("SELECT COALESCE(SUM(outstanding_balance), 0) FROM Loans WHERE outstanding_balance > 0")
-            outstanding_loans = cursor.fetchone()[0]
-            
+            # All five summary scalars in one round trip (same pattern as
+            # the dashboard query) instead of five execute/fetchone pairs
+            ph = _sql_placeholder()
+            cursor.execute(f"""
+                SELECT
+                    (SELECT COUNT(*) FROM Members WHERE status = 'active'),
+                    (SELECT COALESCE(SUM(amount), 0) FROM Contributions
+                     WHERE contribution_date <= {ph}),
+                    (SELECT COALESCE(SUM(loan_amount), 0) FROM Loans
+                     WHERE loan_date <= {ph}),
+                    (SELECT COALESCE(SUM(repayment_amount), 0) FROM Repayments
+                     WHERE repayment_date <= {ph}),
+                    (SELECT COALESCE(SUM(outstanding_balance), 0) FROM Loans
+                     WHERE outstanding_balance > 0)
+            """, (end_date, end_date, end_date))
+            (total_members, total_contributions, total_loans_disbursed,
+             total_repayments, outstanding_loans) = cursor.fetchone()
+
             # Available funds
             available_funds = total_contributions - outstanding_loans
             
@@ -1248,6 +1272,10 @@ class EnhancedReportGenerator:
             }
         
         try:
+            from reportlab.lib.pagesizes import A4
+            from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+            from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+
             # Create PDF document
             doc = SimpleDocTemplate(filename, pagesize=A4)
             styles = getSampleStyleSheet()
@@ -1365,6 +1393,8 @@ class EnhancedReportGenerator:
     
     def _create_summary_sheet(self, sheet, report_data):
         """Create summary sheet in Excel workbook"""
+        from openpyxl.styles import Font, PatternFill
+
         # Headers
         sheet['A1'] = 'Bank Mmudzi Financial Summary'
         sheet['A1'].font = Font(size=16, bold=True)
@@ -1388,6 +1418,8 @@ class EnhancedReportGenerator:
     
     def _create_members_sheet(self, sheet, report_data):
         """Create members sheet in Excel workbook"""
+        from openpyxl.styles import Font, PatternFill
+
         headers = ['Member ID', 'Name', 'Phone', 'Total Contributions', 'Active Loans', 'Status']
         
         # Add headers
@@ -1401,6 +1433,8 @@ class EnhancedReportGenerator:
         
     def _create_loans_sheet(self, sheet, report_data):
         """Create loans sheet in Excel workbook"""
+        from openpyxl.styles import Font, PatternFill
+
         headers = ['Loan ID', 'Member', 'Amount', 'Interest Rate', 'Outstanding', 'Status']
         
         # Add headers
@@ -1411,6 +1445,8 @@ class EnhancedReportGenerator:
     
     def _create_contributions_sheet(self, sheet, report_data):
         """Create contributions sheet in Excel workbook"""
+        from openpyxl.styles import Font, PatternFill
+
         headers = ['Date', 'Member', 'Month', 'Year', 'Amount']
         
         # Add headers
@@ -4130,7 +4166,10 @@ class BackupManager:
         """Restore SQLite database from backup"""
         try:
             import shutil
-            
+
+            # Release the pooled connection so the database file can be replaced
+            self.db_manager.close_thread_connection()
+
             # Create a backup of current database before restore
             current_backup = f"{SQLITE_DB_NAME}.pre_restore_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
             shutil.copy2(SQLITE_DB_NAME, current_backup)
@@ -4486,6 +4525,26 @@ class AuditManager:
 audit_manager = AuditManager()
 
 # Enhanced Database Connection Manager with MySQL Primary and SQLite Fallback
+class _PooledSQLiteConnection:
+    """
+    Proxy around a long-lived sqlite3 connection handed out by the
+    DatabaseManager. close() rolls back any open transaction (matching
+    sqlite3's behaviour on a real close) but keeps the underlying
+    connection open so callers don't pay connection setup per query.
+    """
+
+    def __init__(self, conn):
+        self._conn = conn
+
+    def close(self):
+        try:
+            self._conn.rollback()
+        except sqlite3.Error:
+            pass
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
 class DatabaseManager:
     def __init__(self):
         self.current_db_type = None
@@ -4497,6 +4556,8 @@ class DatabaseManager:
         self.max_retry_attempts = 3
         self.mysql_check_interval = 30  # seconds
         self.last_mysql_check = 0
+        self._thread_local = threading.local()
+        self._mysql_pool = None
         self._initialize_sync_manager()
         self._check_mysql_availability()
     
@@ -4628,14 +4689,19 @@ class DatabaseManager:
             return False
     
     def _get_mysql_connection(self):
-        """Get MySQL connection and create database if needed"""
-        try:
-            # First try to connect to the specific database
-            conn = mysql.connector.connect(
-                **MYSQL_CONFIG,
-                autocommit=False,
-                connection_timeout=10
-            )
+        """Get MySQL connection from the pool, creating the database if needed"""
+        try:
+            # Pooled connections skip the TCP+auth handshake on reuse;
+            # close() returns them to the pool
+            if self._mysql_pool is None:
+                self._mysql_pool = mysql.connector.pooling.MySQLConnectionPool(
+                    pool_name='bank_mmudzi',
+                    pool_size=8,
+                    **MYSQL_CONFIG,
+                    autocommit=False,
+                    connection_timeout=10
+                )
+            conn = self._mysql_pool.get_connection()
             self.current_db_type = 'mysql'
             self.sqlite_fallback_active = False
             
@@ -4646,8 +4712,9 @@ class DatabaseManager:
             
         except mysql.connector.Error as err:
             if err.errno == mysql.connector.errorcode.ER_BAD_DB_ERROR:
-                # Database doesn't exist, create it
+                # Database doesn't exist, create it and rebuild the pool
                 self._create_mysql_database()
+                self._mysql_pool = None
                 conn = mysql.connector.connect(**MYSQL_CONFIG)
                 self.current_db_type = 'mysql'
                 self.sqlite_fallback_active = False
@@ -4679,27 +4746,47 @@ class DatabaseManager:
             raise
     
     def _get_sqlite_connection(self):
-        """Get SQLite connection with fallback tracking"""
-        try:
-            conn = sqlite3.connect(SQLITE_DB_NAME, timeout=30.0)
-            # Enable foreign key constraints
-            conn.execute("PRAGMA foreign_keys = ON")
-            # Enable WAL mode for better concurrency
-            conn.execute("PRAGMA journal_mode = WAL")
-            
+        """Get the thread's long-lived SQLite connection, opening it on first use"""
+        try:
+            conn = getattr(self._thread_local, 'sqlite_conn', None)
+            if conn is None:
+                raw = sqlite3.connect(SQLITE_DB_NAME, timeout=30.0)
+                # Enable foreign key constraints
+                raw.execute("PRAGMA foreign_keys = ON")
+                # Enable WAL mode for better concurrency
+                raw.execute("PRAGMA journal_mode = WAL")
+                # NORMAL sync is durable against application crashes under
+                # WAL and drops the per-commit fsync cost dramatically
+                raw.execute("PRAGMA synchronous = NORMAL")
+                raw.execute("PRAGMA temp_store = MEMORY")
+                # Serve reads from the OS page cache via mmap (256 MB cap)
+                raw.execute("PRAGMA mmap_size = 268435456")
+                conn = _PooledSQLiteConnection(raw)
+                self._thread_local.sqlite_conn = conn
+
             self.current_db_type = 'sqlite'
-            
+
             # Mark that we're in fallback mode if MySQL should be available
             if MYSQL_AVAILABLE and not self.sqlite_fallback_active:
                 self.sqlite_fallback_active = True
                 logger.warning("Operating in SQLite fallback mode - changes will be synced when MySQL is available")
-            
+
             return conn
-            
+
         except sqlite3.Error as e:
             logger.error(f"Failed to connect to SQLite database: {e}")
             messagebox.showerror("Database Error", f"Failed to connect to SQLite database: {e}")
             raise
+
+    def close_thread_connection(self):
+        """Really close this thread's pooled SQLite connection (e.g. before a restore)"""
+        conn = getattr(self._thread_local, 'sqlite_conn', None)
+        if conn is not None:
+            try:
+                conn._conn.close()
+            except sqlite3.Error:
+                pass
+            self._thread_local.sqlite_conn = None
     
     def execute_query(self, query, params=None, fetch_one=False, fetch_all=False):
         """Execute query with automatic connection management and retry logic"""
@@ -4819,9 +4906,87 @@ class DatabaseManager:
 # Global database manager instance
 db_manager = DatabaseManager()
 
+# The placeholder style belongs to the connection actually handed out:
+# the manager can drop to the SQLite fallback (or recover MySQL) at any
+# point, so prebound statements are kept in both styles and resolved
+# against db_manager.current_db_type per call — after connect_db(), so
+# the choice matches the connection just obtained. Per backend the SQL
+# text is still identical on every call, which keeps sqlite3's
+# per-connection statement cache effective.
+def _sql_placeholder():
+    """Placeholder marker for the backend connect_db() is currently using"""
+    return '%s' if db_manager.current_db_type == 'mysql' else '?'
+
+def _bind_placeholders(template):
+    """Prebuild both placeholder-style variants of a statement"""
+    return {'mysql': template.format(ph='%s'), 'sqlite': template.format(ph='?')}
+
+def _sql(variants):
+    """Pick the prebound variant matching the live backend"""
+    return variants['mysql' if db_manager.current_db_type == 'mysql' else 'sqlite']
+
+_SQL_GET_CONFIG_VALUE = _bind_placeholders(
+    'SELECT config_value FROM SystemConfig WHERE config_key = {ph}')
+# Member standing rolls the info/contribution/loan/repayment lookups into a
+# single statement so one round trip serves the whole calculation
+_SQL_MEMBER_STANDING = _bind_placeholders('''
+    SELECT m.name, m.surname, m.member_number, m.status, m.created_at,
+           (SELECT COUNT(*) FROM Contributions WHERE member_id = m.member_id),
+           (SELECT COALESCE(SUM(amount), 0) FROM Contributions WHERE member_id = m.member_id),
+           (SELECT COALESCE(AVG(amount), 0) FROM Contributions WHERE member_id = m.member_id),
+           (SELECT COUNT(*) FROM Loans WHERE member_id = m.member_id),
+           (SELECT COALESCE(SUM(loan_amount), 0) FROM Loans WHERE member_id = m.member_id),
+           (SELECT COALESCE(SUM(outstanding_balance), 0) FROM Loans WHERE member_id = m.member_id),
+           (SELECT COALESCE(SUM(r.repayment_amount), 0) FROM Repayments r
+            JOIN Loans l ON r.loan_id = l.loan_id WHERE l.member_id = m.member_id),
+           (SELECT COALESCE(SUM(r.interest_amount), 0) FROM Repayments r
+            JOIN Loans l ON r.loan_id = l.loan_id WHERE l.member_id = m.member_id),
+           (SELECT COUNT(*) FROM Loans l
+            WHERE l.member_id = m.member_id AND l.outstanding_balance > 0
+              AND julianday('now') - julianday(COALESCE(
+                    (SELECT MAX(repayment_date) FROM Repayments
+                     WHERE loan_id = l.loan_id), l.loan_date)) > 37)
+    FROM Members m WHERE m.member_id = {ph}
+''')
+# Dashboard hot-path statements, built once per backend
+_SQL_DASHBOARD_SUMMARY = _bind_placeholders('''
+    SELECT
+        (SELECT COUNT(*) FROM Members WHERE status = 'active'),
+        (SELECT COUNT(*) FROM Loans WHERE outstanding_balance > 0),
+        (SELECT COALESCE(SUM(amount), 0) FROM Contributions
+         WHERE month = {ph} AND year = {ph}),
+        (SELECT COALESCE(SUM(amount), 0) FROM Contributions),
+        (SELECT COALESCE(SUM(outstanding_balance), 0) FROM Loans)
+''')
+# Activity lines are assembled in SQL so Python receives the final
+# strings and at most 50 characters of old_values per row; the
+# concatenation syntax differs between the two backends
+_SQL_RECENT_ACTIVITIES = {
+    'mysql': '''
+        SELECT CONCAT(timestamp, ': ', operation, ' on ', table_name,
+                      COALESCE(CONCAT(' - ', SUBSTRING(old_values, 1, 50), '...'), ''))
+        FROM AuditLog
+        ORDER BY timestamp DESC
+        LIMIT %s OFFSET %s
+    ''',
+    'sqlite': '''
+        SELECT timestamp || ': ' || operation || ' on ' || table_name ||
+               COALESCE(' - ' || SUBSTR(old_values, 1, 50) || '...', '')
+        FROM AuditLog
+        ORDER BY timestamp DESC
+        LIMIT ? OFFSET ?
+    ''',
+}
+
 # Database connection function (updated to use manager)
 def connect_db():
-    """Legacy function for backward compatibility"""
+    """Legacy function for backward compatibility
+
+    Returns a pooled connection: MySQL comes from the connector's
+    connection pool and SQLite from a long-lived per-thread handle, so
+    the conn = connect_db() / conn.close() idiom used throughout keeps
+    working without paying a real connect/teardown per call.
+    """
     return db_manager.get_connection()
 
 # Initialize database with tables and default values
@@ -4869,6 +5034,12 @@ def initialize_db():
             logger.info("Default admin user verified/created")
         except Exception as user_error:
             logger.warning(f"Failed to create default admin user: {user_error}")
+
+        # Ensure supporting indexes exist for date-range queries
+        try:
+            _create_performance_indexes()
+        except Exception as index_error:
+            logger.warning(f"Failed to create performance indexes: {index_error}")
         
         logger.info(f"Database initialized successfully using {db_manager.current_db_type}")
         
@@ -4884,6 +5055,77 @@ def initialize_db():
             # Don't raise exception - let the app try to continue
             logger.warning("Database initialization incomplete - some features may not work")
 
+# Set at startup when the SQLite build ships FTS5; the member search
+# falls back to LIKE scans when it does not
+_member_fts_available = False
+
+def _create_performance_indexes():
+    """Create indexes that back the date-range reporting queries"""
+    if db_manager.current_db_type != 'sqlite':
+        # MySQL does not support CREATE INDEX IF NOT EXISTS; indexes there
+        # are managed by the migration system
+        return
+
+    conn = connect_db()
+    cursor = conn.cursor()
+
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_loans_date ON Loans(loan_date)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_repayments_date ON Repayments(repayment_date)')
+    # Covering index so COUNT(DISTINCT member_id) per year is answered
+    # from the index alone without touching the table
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_contrib_year_member ON Contributions(year, member_id)')
+    # Dashboard monthly-contributions SUM filters on month and year
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_contrib_year_month ON Contributions(year, month)')
+    # Partial index keeps the active-loan count and outstanding-balance
+    # aggregates from scanning settled loans
+    cursor.execute('''CREATE INDEX IF NOT EXISTS idx_loans_outstanding
+                      ON Loans(outstanding_balance) WHERE outstanding_balance > 0''')
+    # The activity feed orders by timestamp DESC with a LIMIT; without
+    # this the whole audit table is sorted per page
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_audit_ts ON AuditLog(timestamp DESC)')
+
+    # Full-text index over the searchable member columns. The external-
+    # content FTS5 table is kept in sync by triggers, and the member
+    # search becomes a token lookup instead of a LIKE '%term%' scan
+    # that can never use an index
+    global _member_fts_available
+    try:
+        cursor.execute('''
+            CREATE VIRTUAL TABLE IF NOT EXISTS Members_fts USING fts5(
+                name, surname, phone_number, member_number,
+                content='Members', content_rowid='member_id')
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS members_fts_ai AFTER INSERT ON Members BEGIN
+                INSERT INTO Members_fts(rowid, name, surname, phone_number, member_number)
+                VALUES (new.member_id, new.name, new.surname, new.phone_number, new.member_number);
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS members_fts_ad AFTER DELETE ON Members BEGIN
+                INSERT INTO Members_fts(Members_fts, rowid, name, surname, phone_number, member_number)
+                VALUES ('delete', old.member_id, old.name, old.surname, old.phone_number, old.member_number);
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS members_fts_au AFTER UPDATE ON Members BEGIN
+                INSERT INTO Members_fts(Members_fts, rowid, name, surname, phone_number, member_number)
+                VALUES ('delete', old.member_id, old.name, old.surname, old.phone_number, old.member_number);
+                INSERT INTO Members_fts(rowid, name, surname, phone_number, member_number)
+                VALUES (new.member_id, new.name, new.surname, new.phone_number, new.member_number);
+            END
+        ''')
+        # Rebuild once per startup so the index heals after restores or
+        # edits made while the triggers did not exist; Members is small
+        # enough that this is cheap
+        cursor.execute("INSERT INTO Members_fts(Members_fts) VALUES ('rebuild')")
+        _member_fts_available = True
+    except sqlite3.OperationalError as e:
+        logger.info(f"FTS5 unavailable, member search uses LIKE fallback: {e}")
+
+    conn.commit()
+    conn.close()
+
 def _ensure_mysql_database_exists():
     """Ensure MySQL database exists, create if it doesn't"""
     if not MYSQL_AVAILABLE:
@@ -5308,7 +5550,9 @@ def update_member_status(member_id: int, new_status: str, reason: str = None) ->
             audit_message += f" - Reason: {reason}"
             
         audit_manager.log_transaction('Members', 'UPDATE', member_id, old_values, new_values)
-        
+
+        invalidate_member_profile_cache()
+        invalidate_dashboard_cache()
         return True
         
     except Exception as e:
@@ -6515,52 +6759,40 @@ class YearEndProcessor:
         try:
             conn = connect_db()
             cursor = conn.cursor()
-            
-            # Total contributions for the year
-            cursor.execute('''
-                SELECT COALESCE(SUM(amount), 0) FROM Contributions WHERE year = ?
-            ''', (year,))
-            total_contributions = cursor.fetchone()[0]
-            
-            # Total loans disbursed
-            cursor.execute('''
-                SELECT COALESCE(SUM(loan_amount), 0) FROM Loans 
-                WHERE strftime('%Y', loan_date) = ?
-            ''', (str(year),))
-            total_loans_disbursed = cursor.fetchone()[0]
-            
-            # Total repayments received
-            cursor.execute('''
-                SELECT COALESCE(SUM(repayment_amount), 0) FROM Repayments 
-                WHERE strftime('%Y', repayment_date) = ?
-            ''', (str(year),))
-            total_repayments = cursor.fetchone()[0]
-            
-            # Total interest collected
-            cursor.execute('''
-                SELECT COALESCE(SUM(interest_amount), 0) FROM Repayments 
-                WHERE strftime('%Y', repayment_date) = ?
-            ''', (str(year),))
-            total_interest = cursor.fetchone()[0]
-            
-            # Outstanding loans at year end
-            cursor.execute('''
-                SELECT COALESCE(SUM(outstanding_balance), 0) FROM Loans 
-                WHERE outstanding_balance > 0
-            ''')
-            outstanding_balance = cursor.fetchone()[0]
-            
-            # Active members
+
+            # Half-open date range keeps the predicates sargable so the
+            # loan_date/repayment_date indexes are used instead of a
+            # strftime() call per row
+            year_start = f'{year}-01-01'
+            year_end = f'{year + 1}-01-01'
+
+            # Fetch all annual totals in a single round trip using scalar
+            # subqueries instead of six separate statements
             cursor.execute('''
-                SELECT COUNT(DISTINCT member_id) FROM Contributions WHERE year = ?
-            ''', (year,))
-            active_members = cursor.fetchone()[0]
-            
+                SELECT
+                    (SELECT COALESCE(SUM(amount), 0) FROM Contributions WHERE year = ?),
+                    (SELECT COALESCE(SUM(loan_amount), 0) FROM Loans
+                     WHERE loan_date >= ? AND loan_date < ?),
+                    (SELECT COALESCE(SUM(repayment_amount), 0) FROM Repayments
+                     WHERE repayment_date >= ? AND repayment_date < ?),
+                    (SELECT COALESCE(SUM(interest_amount), 0) FROM Repayments
+                     WHERE repayment_date >= ? AND repayment_date < ?),
+                    (SELECT COALESCE(SUM(outstanding_balance), 0) FROM Loans
+                     WHERE outstanding_balance > 0),
+                    (SELECT COUNT(DISTINCT member_id) FROM Contributions WHERE year = ?)
+            ''', (year, year_start, year_end, year_start, year_end,
+                  year_start, year_end, year))
+            (total_contributions, total_loans_disbursed, total_repayments,
+             total_interest, outstanding_balance, active_members) = cursor.fetchone()
+
             conn.close()
             
             # Calculate key metrics
             net_fund_growth = total_contributions + total_interest - total_loans_disbursed
-            loan_recovery_rate = (total_repayments / total_loans_disbursed * 100) if total_loans_disbursed > 0 else 0
+            # Branch-free: `or 1.0` guards the zero divisor and the boolean
+            # factor zeroes the rate when nothing was disbursed
+            loan_recovery_rate = (total_repayments * 100.0 / (total_loans_disbursed or 1.0)
+                                  * (total_loans_disbursed > 0))
             
             return {
                 'success': True,
@@ -6592,7 +6824,12 @@ class YearEndProcessor:
         try:
             conn = connect_db()
             cursor = conn.cursor()
-            
+
+            # Take the write lock once so all three statements share a
+            # single transaction (and a single fsync at commit)
+            if db_manager.current_db_type != 'mysql':
+                cursor.execute('BEGIN IMMEDIATE')
+
             # Archive previous year's dividend calculations
             previous_year = new_year - 1
             cursor.execute('''
@@ -6648,25 +6885,41 @@ class YearEndProcessor:
         try:
             # Calculate all dividends for the year
             dividend_results = calculate_all_dividends_for_year(year)
-            
-            if not dividend_results['distribution_valid']:
+
+            # Validate the stored calculations against the available fund
+            # before touching any status rows (0.02 matches
+            # FinancialCalculator.validate_dividend_distribution tolerance).
+            # Checked as its own SELECT rather than a WHERE guard on the
+            # UPDATE: an update touching zero rows (year already marked
+            # ready, or nothing calculated) is not a validation failure
+            conn = connect_db()
+            cursor = conn.cursor()
+
+            cursor.execute('''
+                SELECT ABS(COALESCE(SUM(dividend_amount), 0) - (
+                         (SELECT COALESCE(SUM(amount), 0) FROM Contributions WHERE year = ?)
+                       + (SELECT COALESCE(SUM(interest_amount), 0) FROM Repayments
+                          WHERE repayment_date >= ? AND repayment_date < ?)))
+                FROM DividendCalculations WHERE year = ?
+            ''', (year, f'{year}-01-01', f'{year + 1}-01-01', year))
+            fund_difference = cursor.fetchone()[0]
+
+            if fund_difference > 0.02 or not dividend_results['distribution_valid']:
+                conn.close()
                 return {
                     'success': False,
                     'message': 'Dividend distribution validation failed. Total dividends do not match available funds.',
                     'total_fund': dividend_results['total_fund'],
                     'total_dividends': dividend_results['total_dividends']
                 }
-            
+
             # Mark dividends as ready for distribution
-            conn = connect_db()
-            cursor = conn.cursor()
-            
             cursor.execute('''
-                UPDATE DividendCalculations 
-                SET status = 'ready_for_distribution' 
+                UPDATE DividendCalculations
+                SET status = 'ready_for_distribution'
                 WHERE year = ? AND status = 'calculated'
             ''', (year,))
-            
+
             # Log the dividend processing
             audit_manager.log_action(
                 'SYSTEM', 'DividendDistribution', year,
@@ -6700,39 +6953,63 @@ class SystemConfigManager:
     Manages system configuration settings using the SystemConfig table
     """
     
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _fetch_config_value(key: str) -> Optional[str]:
+        """Fetch a configuration value from the database (cached per key)"""
+        conn = connect_db()
+        cursor = conn.cursor()
+
+        cursor.execute(_sql(_SQL_GET_CONFIG_VALUE), (key,))
+
+        result = cursor.fetchone()
+        conn.close()
+
+        return result[0] if result else None
+
     @staticmethod
     def get_config_value(key: str, default_value: str = None) -> str:
         """
         Get a configuration value by key
-        
+
+        Config reads are cached; hot callers such as the default-amount
+        helpers avoid a database round trip on repeated lookups.
+
         Args:
             key (str): Configuration key
             default_value (str): Default value if key not found
-            
+
         Returns:
             str: Configuration value
         """
         try:
-            conn = connect_db()
-            cursor = conn.cursor()
-            
-            # Use database-specific syntax
-            if db_manager.current_db_type == 'mysql':
-                cursor.execute('SELECT config_value FROM SystemConfig WHERE config_key = %s', (key,))
-            else:
-                cursor.execute('SELECT config_value FROM SystemConfig WHERE config_key = ?', (key,))
-            
-            result = cursor.fetchone()
-            conn.close()
-            
-            if result:
-                return result[0]
+            result = SystemConfigManager._fetch_config_value(key)
+
+            if result is not None:
+                return result
             else:
                 return default_value
-                
+
         except Exception as e:
             logger.error(f"Error getting config value for {key}: {str(e)}")
             return default_value
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def get_config_value_cached(key: str, default_value: str = None) -> str:
+        """
+        Memoized variant of get_config_value for hot read paths such as
+        per-member standing computation; keyed on (key, default).
+        """
+        return SystemConfigManager.get_config_value(key, default_value)
+
+    @staticmethod
+    def invalidate_config_cache():
+        """Drop cached config reads after a configuration change"""
+        SystemConfigManager._fetch_config_value.cache_clear()
+        SystemConfigManager.get_config_value_cached.cache_clear()
+        SystemConfigManager.get_default_contribution_amount.cache_clear()
+        SystemConfigManager.get_default_interest_rate.cache_clear()
     
     @staticmethod
     def set_config_value(key: str, value: str, description: str = None) -> bool:
@@ -6750,59 +7027,43 @@ class SystemConfigManager:
         try:
             conn = connect_db()
             cursor = conn.cursor()
-            
-            # Check if key exists using database-specific syntax
+
+            # Integer epoch seconds: cheaper to store and compare than a
+            # formatted string; format only at presentation time
+            now_ts = int(time.time())
+
+            # Atomic upsert on the config_key primary key; one statement
+            # instead of SELECT-then-INSERT/UPDATE (which was also racy)
             if db_manager.current_db_type == 'mysql':
-                cursor.execute('SELECT config_key FROM SystemConfig WHERE config_key = %s', (key,))
-                exists = cursor.fetchone()
-                
-                if exists:
-                    # Update existing
-                    cursor.execute('''
-                        UPDATE SystemConfig 
-                        SET config_value = %s, updated_at = %s
-                        WHERE config_key = %s
-                    ''', (value, datetime.now().strftime('%Y-%m-%d %H:%M:%S'), key))
-                    operation = 'UPDATE'
-                else:
-                    # Insert new
-                    cursor.execute('''
-                        INSERT INTO SystemConfig (config_key, config_value, description, created_at, updated_at)
-                        VALUES (%s, %s, %s, %s, %s)
-                    ''', (key, value, description, 
-                          datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                          datetime.now().strftime('%Y-%m-%d %H:%M:%S')))
+                cursor.execute('''
+                    INSERT INTO SystemConfig (config_key, config_value, description, created_at, updated_at)
+                    VALUES (%s, %s, %s, %s, %s)
+                    ON DUPLICATE KEY UPDATE
+                        config_value = VALUES(config_value),
+                        updated_at = VALUES(updated_at)
+                ''', (key, value, description, now_ts, now_ts))
             else:
-                cursor.execute('SELECT config_key FROM SystemConfig WHERE config_key = ?', (key,))
-                exists = cursor.fetchone()
-                
-                if exists:
-                    # Update existing
-                    cursor.execute('''
-                        UPDATE SystemConfig 
-                        SET config_value = ?, updated_at = ?
-                        WHERE config_key = ?
-                    ''', (value, datetime.now().strftime('%Y-%m-%d %H:%M:%S'), key))
-                    operation = 'UPDATE'
-                else:
-                    # Insert new
-                    cursor.execute('''
-                        INSERT INTO SystemConfig (config_key, config_value, description, created_at, updated_at)
-                        VALUES (?, ?, ?, ?, ?)
-                    ''', (key, value, description, 
-                          datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                          datetime.now().strftime('%Y-%m-%d %H:%M:%S')))
-                operation = 'INSERT'
+                cursor.execute('''
+                    INSERT INTO SystemConfig (config_key, config_value, description, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT(config_key) DO UPDATE SET
+                        config_value = excluded.config_value,
+                        updated_at = excluded.updated_at
+                ''', (key, value, description, now_ts, now_ts))
+            operation = 'UPSERT'
             
             conn.commit()
             conn.close()
-            
+
+            # Cached reads are stale after a write
+            SystemConfigManager.invalidate_config_cache()
+
             # Log configuration change
             audit_manager.log_transaction('SystemConfig', operation, None, None, {
                 'config_key': key,
                 'config_value': value,
                 'description': description,
-                'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                'timestamp': now_ts
             })
             
             return True
@@ -6812,17 +7073,19 @@ class SystemConfigManager:
             return False
     
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_default_contribution_amount() -> float:
-        """Get default monthly contribution amount"""
+        """Get default monthly contribution amount (cached, read-mostly)"""
         value = SystemConfigManager.get_config_value('default_contribution_amount', '100.0')
         try:
             return float(value)
         except ValueError:
             return 100.0
-    
+
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_default_interest_rate() -> float:
-        """Get default loan interest rate (monthly)"""
+        """Get default loan interest rate (monthly, cached, read-mostly)"""
         value = SystemConfigManager.get_config_value('default_interest_rate', '0.2')
         try:
             return float(value)
@@ -6843,10 +7106,34 @@ class SystemConfigManager:
             ('max_loan_amount', '5000.0', 'Maximum loan amount allowed')
         ]
         
-        for key, value, description in default_configs:
-            # Only set if doesn't exist
-            if SystemConfigManager.get_config_value(key) is None:
-                SystemConfigManager.set_config_value(key, value, description)
+        try:
+            conn = connect_db()
+            cursor = conn.cursor()
+
+            # One prepared statement with 8 bindings; INSERT OR IGNORE keeps
+            # the "only insert if missing" semantics without a SELECT per key
+            now_ts = int(time.time())
+            rows = [(key, value, description, now_ts, now_ts)
+                    for key, value, description in default_configs]
+
+            if db_manager.current_db_type == 'mysql':
+                cursor.executemany('''
+                    INSERT IGNORE INTO SystemConfig (config_key, config_value, description, created_at, updated_at)
+                    VALUES (%s, %s, %s, %s, %s)
+                ''', rows)
+            else:
+                cursor.executemany('''
+                    INSERT OR IGNORE INTO SystemConfig (config_key, config_value, description, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?)
+                ''', rows)
+
+            conn.commit()
+            conn.close()
+
+            SystemConfigManager.invalidate_config_cache()
+
+        except Exception as e:
+            logger.error(f"Error initializing default config: {str(e)}")
 
 # Login Window with Registration
 class LoginWindow(tk.Tk):
@@ -6859,85 +7146,81 @@ class LoginWindow(tk.Tk):
         
         # Center the window
         self.center_window()
-        
+
+        # Shared font objects: Tk resolves each distinct font spec against
+        # the display, so reusing instances avoids repeated lookups
+        self.base_font = tkfont.Font(family='Arial', size=10)
+        self.bold_font = tkfont.Font(family='Arial', size=10, weight='bold')
+
         # Main content frame
         main_frame = tk.Frame(self, bg='#f0f0f0')
         main_frame.pack(fill='both', expand=True, padx=20, pady=20)
-        
+        self.main_frame = main_frame
+
         # Title
         title_label = tk.Label(
-            main_frame, 
-            text="Bank Mmudzi", 
-            font=('Arial', 18, 'bold'),
+            main_frame,
+            text="Bank Mmudzi",
+            font=tkfont.Font(family='Arial', size=18, weight='bold'),
             bg='#f0f0f0',
             fg='#2c3e50'
         )
         title_label.pack(pady=(0, 20))
-        
-        tk.Label(main_frame, text="Username:", bg='#f0f0f0', font=('Arial', 10)).pack(pady=(10, 5))
-        self.username_entry = tk.Entry(main_frame, font=('Arial', 10), width=25)
+
+        tk.Label(main_frame, text="Username:", bg='#f0f0f0', font=self.base_font).pack(pady=(10, 5))
+        self.username_entry = tk.Entry(main_frame, font=self.base_font, width=25)
         self.username_entry.pack(pady=5)
-        
-        tk.Label(main_frame, text="Password:", bg='#f0f0f0', font=('Arial', 10)).pack(pady=(10, 5))
-        self.password_entry = tk.Entry(main_frame, show='*', font=('Arial', 10), width=25)
+
+        tk.Label(main_frame, text="Password:", bg='#f0f0f0', font=self.base_font).pack(pady=(10, 5))
+        self.password_entry = tk.Entry(main_frame, show='*', font=self.base_font, width=25)
         self.password_entry.pack(pady=5)
-        
+
         button_frame = tk.Frame(main_frame, bg='#f0f0f0')
         button_frame.pack(pady=15)
-        
-        tk.Button(button_frame, text="Login", command=self.try_login, 
-                 bg='#4CAF50', fg='white', font=('Arial', 10, 'bold'),
+
+        tk.Button(button_frame, text="Login", command=self.try_login,
+                 bg='#4CAF50', fg='white', font=self.bold_font,
                  padx=20, pady=8).pack(side='left', padx=5)
-        tk.Button(button_frame, text="Register", command=self.show_register_dialog, 
-                 bg='#2196F3', fg='white', font=('Arial', 10, 'bold'),
+        tk.Button(button_frame, text="Register", command=self.show_register_dialog,
+                 bg='#2196F3', fg='white', font=self.bold_font,
                  padx=20, pady=8).pack(side='left', padx=5)
-        
+
+        # Bind Enter key to login
+        self.bind('<Return>', lambda event: self.try_login())
+        self.username_entry.focus()
+
+        # The developer info frame is cosmetic; defer it so the login form
+        # accepts input before those widgets are rendered
+        self.after(100, self._create_dev_info)
+
+    def _create_dev_info(self):
+        """Build the deferred developer info section below the login form"""
         # Add separator line
-        separator = tk.Frame(main_frame, height=2, bg='#bdc3c7')
+        separator = tk.Frame(self.main_frame, height=2, bg='#bdc3c7')
         separator.pack(fill='x', pady=(15, 10))
-        
+
         # Developer info directly in main frame (more visible)
-        dev_info_frame = tk.Frame(main_frame, bg='#f0f0f0')
+        dev_info_frame = tk.Frame(self.main_frame, bg='#f0f0f0')
         dev_info_frame.pack(pady=5)
-        
-        dev_label = tk.Label(
-            dev_info_frame,
-            text="Developer: Nehemiah Nganjo",
-            font=('Arial', 9, 'bold'),
-            fg='#2c3e50',
-            bg='#f0f0f0'
-        )
-        dev_label.pack()
-        
-        contact_label = tk.Label(
-            dev_info_frame,
-            text="Phone: 0997082156",
-            font=('Arial', 8),
-            fg='#34495e',
-            bg='#f0f0f0'
-        )
-        contact_label.pack()
-        
-        github_label = tk.Label(
-            dev_info_frame,
-            text="GitHub: github.com/Nehemiahnganjo",
-            font=('Arial', 8),
-            fg='#3498db',
-            bg='#f0f0f0',
-            cursor="hand2"
-        )
-        github_label.pack()
-        
-        # Make GitHub link clickable
+
+        # Declarative widget spec, iterated once
+        dev_labels = [
+            ("Developer: Nehemiah Nganjo", tkfont.Font(family='Arial', size=9, weight='bold'), '#2c3e50', None),
+            ("Phone: 0997082156", tkfont.Font(family='Arial', size=8), '#34495e', None),
+            ("GitHub: github.com/Nehemiahnganjo", tkfont.Font(family='Arial', size=8), '#3498db', "hand2"),
+        ]
+
+        for text, font, fg, cursor in dev_labels:
+            label = tk.Label(dev_info_frame, text=text, font=font, fg=fg, bg='#f0f0f0',
+                             cursor=cursor or '')
+            label.pack()
+
+        # Make GitHub link clickable (label is the last one packed)
         def open_github(event):
             import webbrowser
             webbrowser.open("https://github.com/Nehemiahnganjo")
-        
-        github_label.bind("<Button-1>", open_github)
-        
-        # Bind Enter key to login
-        self.bind('<Return>', lambda event: self.try_login())
-        self.username_entry.focus()
+
+        label.bind("<Button-1>", open_github)
     
     def center_window(self):
         """Center the login window on screen"""
@@ -7030,6 +7313,77 @@ class LoginWindow(tk.Tk):
                  bg='#4CAF50', fg='white').pack(pady=10)
 
 # Member Analysis and Filtering System
+# Standing categories with their lower score bounds; bisect maps a score to
+# its category in one lookup and np.digitize reuses the same thresholds
+STANDING_CATEGORIES = ("Poor", "Fair", "Good", "Excellent")
+STANDING_THRESHOLDS = (60, 75, 90)
+
+def _standing_category(score: float) -> str:
+    """Map a standing score (0-100) to its category name"""
+    return STANDING_CATEGORIES[bisect.bisect_right(STANDING_THRESHOLDS, score)]
+
+def _standing_score_kernel(overdue_count: int, total_contributions: float,
+                           expected_contributions: float, total_borrowed: float,
+                           total_repaid: float):
+    """
+    Pure numeric kernel for the member standing score (0-100).
+
+    Kept free of Python objects so it can be JIT-compiled by Numba when
+    available; returns (score, contribution_rate).
+    """
+    score = 100.0
+
+    # Deduct for overdue loans
+    if overdue_count > 0:
+        score -= min(50.0, overdue_count * 10.0)
+
+    # Deduct for low contribution rate
+    contribution_rate = (total_contributions / expected_contributions
+                         if expected_contributions > 0 else 1.0)
+    if contribution_rate < 0.8:
+        score -= (0.8 - contribution_rate) * 50.0
+
+    # Bonus for consistent repayments
+    if total_borrowed > 0 and total_repaid / total_borrowed > 0.9:
+        score += 10.0
+
+    return max(0.0, min(100.0, score)), contribution_rate
+
+if NUMBA_AVAILABLE:
+    _standing_score_kernel = njit(cache=True)(_standing_score_kernel)
+
+if NUMPY_AVAILABLE:
+    def _score_members_batch(contribs, borrowed, repaid, overdue, expected):
+        """
+        Batch variant of the standing kernel over parallel arrays.
+
+        Returns (scores, category indices) where the index maps into
+        ("Poor", "Fair", "Good", "Excellent"). Compiled with
+        numba.njit(parallel=True) when available.
+        """
+        n = contribs.shape[0]
+        out_score = np.empty(n, np.float64)
+        out_cat = np.empty(n, np.int8)
+        for i in prange(n):
+            score = 100.0
+            if overdue[i] > 0:
+                score -= min(50.0, overdue[i] * 10.0)
+            rate = contribs[i] / expected if expected > 0 else 1.0
+            if rate < 0.8:
+                score -= (0.8 - rate) * 50.0
+            if borrowed[i] > 0 and repaid[i] / borrowed[i] > 0.9:
+                score += 10.0
+            score = max(0.0, min(100.0, score))
+            out_score[i] = score
+            out_cat[i] = (score >= 60) + (score >= 75) + (score >= 90)
+        return out_score, out_cat
+
+    if NUMBA_AVAILABLE:
+        _score_members_batch = njit(parallel=True, cache=True)(_score_members_batch)
+        # Warm the JIT with a size-1 call so the first real batch doesn't
+        # pay the compile cost
+        _score_members_batch(np.zeros(1), np.zeros(1), np.zeros(1), np.zeros(1), 1.0)
+
 class MemberAnalyzer:
     """
     Provides advanced member analysis and filtering capabilities
@@ -7052,61 +7406,59 @@ class MemberAnalyzer:
             conn = connect_db()
             cursor = conn.cursor()
             
-            # Base query for overdue loans
+            # Base query for overdue loans. The 30-day cycle plus 7-day
+            # grace arithmetic runs in SQL via julianday, so only rows that
+            # are actually overdue reach Python and no per-row strptime is
+            # needed
             base_query = '''
-                SELECT l.loan_id, l.member_id, m.name, m.surname, 
+                SELECT l.loan_id, l.member_id, m.name, m.surname,
                        l.loan_amount, l.outstanding_balance, l.loan_date,
-                       l.monthly_payment, COALESCE(MAX(r.repayment_date), l.loan_date) as last_payment
+                       l.monthly_payment, COALESCE(MAX(r.repayment_date), l.loan_date) as last_payment,
+                       date(COALESCE(MAX(r.repayment_date), l.loan_date), '+30 day') as expected_payment_date,
+                       CAST(julianday('now') - julianday(COALESCE(MAX(r.repayment_date), l.loan_date)) - 37 AS INTEGER) as days_overdue
                 FROM Loans l
                 JOIN Members m ON l.member_id = m.member_id
                 LEFT JOIN Repayments r ON l.loan_id = r.loan_id
                 WHERE l.outstanding_balance > 0
             '''
-            
+
             params = []
             if member_id:
                 base_query += ' AND l.member_id = ?'
                 params.append(member_id)
-            
-            base_query += ' GROUP BY l.loan_id'
-            
+
+            base_query += ' GROUP BY l.loan_id HAVING days_overdue > 0'
+
+            # Iterate the cursor directly so rows are converted to dicts in
+            # one pass instead of materializing a list of tuples first
+            cursor.arraysize = 256
             cursor.execute(base_query, params)
-            loans = cursor.fetchall()
-            
-            overdue_loans = []
-            current_date = datetime.now()
-            
-            for loan in loans:
-                loan_id, member_id, name, surname, loan_amount, outstanding_balance, loan_date, monthly_payment, last_payment = loan
-                
-                # Calculate expected next payment date
-                last_payment_date = datetime.strptime(last_payment, '%Y-%m-%d')
-                expected_payment_date = last_payment_date + timedelta(days=30)
-                
-                # Check if overdue (with 7-day grace period)
-                days_overdue = (current_date - expected_payment_date).days - 7
-                
-                if days_overdue > 0:
-                    overdue_loans.append({
-                        'loan_id': loan_id,
-                        'member_id': member_id,
-                        'member_name': f"{name} {surname}",
-                        'loan_amount': loan_amount,
-                        'outstanding_balance': outstanding_balance,
-                        'monthly_payment': monthly_payment,
-                        'last_payment_date': last_payment,
-                        'expected_payment_date': expected_payment_date.strftime('%Y-%m-%d'),
-                        'days_overdue': days_overdue,
-                        'overdue_amount': monthly_payment  # Simplified - could be more complex
-                    })
-            
-            conn.close()
-            return overdue_loans
+
+            overdue_loans = [
+                {
+                    'loan_id': loan_id,
+                    'member_id': loan_member_id,
+                    'member_name': f"{name} {surname}",
+                    'loan_amount': loan_amount,
+                    'outstanding_balance': outstanding_balance,
+                    'monthly_payment': monthly_payment,
+                    'last_payment_date': last_payment,
+                    'expected_payment_date': expected_payment_date,
+                    'days_overdue': days_overdue,
+                    'overdue_amount': monthly_payment  # Simplified - could be more complex
+                }
+                for (loan_id, loan_member_id, name, surname, loan_amount,
+                     outstanding_balance, loan_date, monthly_payment, last_payment,
+                     expected_payment_date, days_overdue) in cursor
+            ]
+
+            conn.close()
+            return overdue_loans
             
         except Exception as e:
             logger.error(f"Error calculating overdue loans: {str(e)}")
             return []
-    
+
     def filter_members_by_criteria(self, status: str = None, contribution_level: str = None, 
                                  loan_status: str = None) -> list:
         """
@@ -7123,8 +7475,9 @@ class MemberAnalyzer:
         try:
             conn = connect_db()
             cursor = conn.cursor()
-            
-            # Base query
+
+            # Base query; all filters are evaluated inside SQLite so only
+            # matching rows cross back into Python
             query = '''
                 SELECT m.member_id, m.member_number, m.name, m.surname, m.phone_number, m.status,
                        COALESCE(SUM(c.amount), 0) as total_contributions,
@@ -7135,51 +7488,68 @@ class MemberAnalyzer:
                 LEFT JOIN Loans l ON m.member_id = l.member_id AND l.outstanding_balance > 0
                 WHERE 1=1
             '''
-            
+
             params = []
-            
+
             # Apply status filter
             if status:
                 query += ' AND m.status = ?'
                 params.append(status)
-            
+
+            # Overdue = no repayment within the 30-day cycle plus the
+            # 7-day grace period (same rule as calculate_overdue_loans)
+            if loan_status == 'overdue':
+                query += '''
+                    AND m.member_id IN (
+                        SELECT member_id FROM Loans
+                        WHERE outstanding_balance > 0
+                          AND julianday('now') - julianday(
+                                COALESCE((SELECT MAX(repayment_date) FROM Repayments
+                                          WHERE Repayments.loan_id = Loans.loan_id), loan_date)
+                              ) > 37
+                    )
+                '''
+
             query += ' GROUP BY m.member_id'
-            
+
+            having_clauses = []
+
+            # Apply contribution level filter against the annual expectation
+            if contribution_level:
+                monthly_contribution = float(self.config_manager.get_config_value_cached('monthly_contribution_amount', 100))
+                annual_expected = monthly_contribution * 12
+
+                if annual_expected > 0:
+                    if contribution_level == 'high':
+                        having_clauses.append('COALESCE(SUM(c.amount), 0) >= ? * 0.8')
+                        params.append(annual_expected)
+                    elif contribution_level == 'medium':
+                        having_clauses.append(
+                            'COALESCE(SUM(c.amount), 0) >= ? * 0.5 AND COALESCE(SUM(c.amount), 0) < ? * 0.8')
+                        params.extend([annual_expected, annual_expected])
+                    elif contribution_level == 'low':
+                        having_clauses.append('COALESCE(SUM(c.amount), 0) < ? * 0.5')
+                        params.append(annual_expected)
+                elif contribution_level in ('high', 'medium'):
+                    # Ratio is defined as 0 when nothing is expected
+                    having_clauses.append('1 = 0')
+
+            # Apply loan status filter on the aggregated balance
+            if loan_status == 'active':
+                having_clauses.append('COALESCE(SUM(l.outstanding_balance), 0) > 0')
+            elif loan_status == 'paid':
+                having_clauses.append('COALESCE(SUM(l.outstanding_balance), 0) <= 0')
+
+            if having_clauses:
+                query += ' HAVING ' + ' AND '.join(having_clauses)
+
+            # Stream rows off the cursor in one pass rather than buffering
+            # them as tuples first
+            cursor.arraysize = 256
             cursor.execute(query, params)
-            members = cursor.fetchall()
-            
-            filtered_members = []
-            
-            for member in members:
-                member_id, member_number, name, surname, phone, member_status, total_contributions, outstanding_loans, loan_count = member
-                
-                # Apply contribution level filter
-                if contribution_level:
-                    monthly_contribution = float(self.config_manager.get_config_value('monthly_contribution_amount', 100))
-                    annual_expected = monthly_contribution * 12
-                    
-                    contribution_ratio = total_contributions / annual_expected if annual_expected > 0 else 0
-                    
-                    if contribution_level == 'high' and contribution_ratio < 0.8:
-                        continue
-                    elif contribution_level == 'medium' and (contribution_ratio < 0.5 or contribution_ratio >= 0.8):
-                        continue
-                    elif contribution_level == 'low' and contribution_ratio >= 0.5:
-                        continue
-                
-                # Apply loan status filter
-                if loan_status:
-                    if loan_status == 'active' and outstanding_loans <= 0:
-                        continue
-                    elif loan_status == 'paid' and outstanding_loans > 0:
-                        continue
-                    elif loan_status == 'overdue':
-                        # Check if member has overdue loans
-                        overdue_loans = self.calculate_overdue_loans(member_id)
-                        if not overdue_loans:
-                            continue
-                
-                filtered_members.append({
+
+            filtered_members = [
+                {
                     'member_id': member_id,
                     'member_number': member_number,
                     'name': name,
@@ -7189,15 +7559,111 @@ class MemberAnalyzer:
                     'total_contributions': total_contributions,
                     'outstanding_loans': outstanding_loans,
                     'loan_count': loan_count
-                })
-            
+                }
+                for (member_id, member_number, name, surname, phone, member_status,
+                     total_contributions, outstanding_loans, loan_count) in cursor
+            ]
+
             conn.close()
             return filtered_members
-            
+
         except Exception as e:
             logger.error(f"Error filtering members: {str(e)}")
             return []
     
+    def calculate_all_member_standings(self) -> list:
+        """
+        Score every member in one pass.
+
+        Pulls per-member aggregates with a single query and computes the
+        standing scores as NumPy array operations when available (falling
+        back to the scalar kernel per row), instead of invoking
+        calculate_member_standing once per member.
+
+        Returns:
+            list: One dict per member with score and category
+        """
+        try:
+            conn = connect_db()
+            cursor = conn.cursor()
+
+            cursor.execute('''
+                SELECT m.member_id, m.name, m.surname, m.member_number, m.status,
+                       (SELECT COALESCE(SUM(amount), 0) FROM Contributions WHERE member_id = m.member_id),
+                       (SELECT COALESCE(SUM(loan_amount), 0) FROM Loans WHERE member_id = m.member_id),
+                       (SELECT COALESCE(SUM(r.repayment_amount), 0) FROM Repayments r
+                        JOIN Loans l ON r.loan_id = l.loan_id WHERE l.member_id = m.member_id),
+                       (SELECT COUNT(*) FROM Loans l
+                        WHERE l.member_id = m.member_id AND l.outstanding_balance > 0
+                          AND julianday('now') - julianday(COALESCE(
+                                (SELECT MAX(repayment_date) FROM Repayments
+                                 WHERE loan_id = l.loan_id), l.loan_date)) > 37)
+                FROM Members m
+            ''')
+            rows = cursor.fetchall()
+            conn.close()
+
+            expected_contributions = float(
+                self.config_manager.get_config_value_cached('monthly_contribution_amount', 100)) * 12
+
+            if NUMPY_AVAILABLE and rows:
+                contribs = np.array([row[5] for row in rows], dtype=np.float64)
+                borrowed = np.array([row[6] for row in rows], dtype=np.float64)
+                repaid = np.array([row[7] for row in rows], dtype=np.float64)
+                overdue = np.array([row[8] for row in rows], dtype=np.float64)
+
+                if expected_contributions > 0:
+                    rates = contribs / expected_contributions
+                else:
+                    rates = np.ones_like(contribs)
+
+                if NUMBA_AVAILABLE:
+                    # JIT-compiled parallel loop over the cohort
+                    scores, categories = _score_members_batch(
+                        contribs, borrowed, repaid, overdue, expected_contributions)
+                else:
+                    scores = (100.0
+                              - np.minimum(50.0, overdue * 10.0)
+                              - np.maximum(0.0, 0.8 - rates) * 50.0
+                              + np.where((borrowed > 0)
+                                         & (repaid / np.where(borrowed > 0, borrowed, 1.0) > 0.9),
+                                         10.0, 0.0))
+                    scores = np.clip(scores, 0.0, 100.0)
+                    categories = np.digitize(scores, STANDING_THRESHOLDS)
+
+                score_of = lambda i: float(scores[i])
+                rate_of = lambda i: float(rates[i])
+                category_of = lambda i: STANDING_CATEGORIES[categories[i]]
+            else:
+                results = [_standing_score_kernel(row[8], float(row[5]), expected_contributions,
+                                                  float(row[6]), float(row[7]))
+                           for row in rows]
+
+                score_of = lambda i: results[i][0]
+                rate_of = lambda i: results[i][1]
+                category_of = lambda i: _standing_category(results[i][0])
+
+            return [
+                {
+                    'member_id': row[0],
+                    'member_name': f"{row[1]} {row[2]}",
+                    'member_number': row[3],
+                    'status': row[4],
+                    'total_contributions': row[5],
+                    'total_borrowed': row[6],
+                    'total_repaid': row[7],
+                    'overdue_loans_count': row[8],
+                    'standing_score': round(score_of(i), 1),
+                    'standing_category': category_of(i),
+                    'contribution_rate': round(rate_of(i) * 100, 1)
+                }
+                for i, row in enumerate(rows)
+            ]
+
+        except Exception as e:
+            logger.error(f"Error calculating member standings: {str(e)}")
+            return []
+
     def calculate_member_standing(self, member_id: int) -> dict:
         """
         Calculate comprehensive member standing
@@ -7212,102 +7678,26 @@ class MemberAnalyzer:
             conn = connect_db()
             cursor = conn.cursor()
             
-            # Get member basic info using database-specific syntax
-            if db_manager.current_db_type == 'mysql':
-                cursor.execute('''
-                    SELECT name, surname, member_number, status, created_at
-                    FROM Members WHERE member_id = %s
-                ''', (member_id,))
-                member_info = cursor.fetchone()
-                
-                if not member_info:
-                    return {'success': False, 'message': 'Member not found'}
-                
-                name, surname, member_number, status, created_date = member_info
-                
-                # Calculate contribution metrics
-                cursor.execute('''
-                    SELECT COUNT(*) as months_contributed, 
-                           COALESCE(SUM(amount), 0) as total_contributions,
-                           COALESCE(AVG(amount), 0) as avg_contribution
-                    FROM Contributions WHERE member_id = %s
-                ''', (member_id,))
-            else:
-                cursor.execute('''
-                    SELECT name, surname, member_number, status, created_at
-                    FROM Members WHERE member_id = ?
-                ''', (member_id,))
-                member_info = cursor.fetchone()
-                
-                if not member_info:
-                    return {'success': False, 'message': 'Member not found'}
-                
-                name, surname, member_number, status, created_date = member_info
-                
-                # Calculate contribution metrics
-                cursor.execute('''
-                    SELECT COUNT(*) as months_contributed, 
-                           COALESCE(SUM(amount), 0) as total_contributions,
-                           COALESCE(AVG(amount), 0) as avg_contribution
-                    FROM Contributions WHERE member_id = ?
-                ''', (member_id,))
-            contrib_data = cursor.fetchone()
-            months_contributed, total_contributions, avg_contribution = contrib_data
-            
-            # Calculate loan metrics
-            cursor.execute('''
-                SELECT COUNT(*) as total_loans,
-                       COALESCE(SUM(loan_amount), 0) as total_borrowed,
-                       COALESCE(SUM(outstanding_balance), 0) as outstanding_balance
-                FROM Loans WHERE member_id = ?
-            ''', (member_id,))
-            loan_data = cursor.fetchone()
-            total_loans, total_borrowed, outstanding_balance = loan_data
-            
-            # Calculate repayment metrics
-            cursor.execute('''
-                SELECT COALESCE(SUM(r.repayment_amount), 0) as total_repaid,
-                       COALESCE(SUM(r.interest_amount), 0) as total_interest_paid
-                FROM Repayments r
-                JOIN Loans l ON r.loan_id = l.loan_id
-                WHERE l.member_id = ?
-            ''', (member_id,))
-            repayment_data = cursor.fetchone()
-            total_repaid, total_interest_paid = repayment_data
-            
-            # Check for overdue loans
-            overdue_loans = self.calculate_overdue_loans(member_id)
-            
-            # Calculate standing score (0-100)
-            standing_score = 100
-            
-            # Deduct for overdue loans
-            if overdue_loans:
-                standing_score -= min(50, len(overdue_loans) * 10)
-            
-            # Deduct for low contribution rate
-            expected_contributions = float(self.config_manager.get_config_value('monthly_contribution_amount', 100)) * 12
-            contribution_rate = (total_contributions / expected_contributions) if expected_contributions > 0 else 1
-            if contribution_rate < 0.8:
-                standing_score -= (0.8 - contribution_rate) * 50
-            
-            # Bonus for consistent repayments
-            if total_borrowed > 0:
-                repayment_rate = total_repaid / total_borrowed
-                if repayment_rate > 0.9:
-                    standing_score += 10
-            
-            standing_score = max(0, min(100, standing_score))
+            # All member/contribution/loan/repayment metrics in one query
+            cursor.execute(_sql(_SQL_MEMBER_STANDING), (member_id,))
+            member_info = cursor.fetchone()
+
+            if not member_info:
+                return {'success': False, 'message': 'Member not found'}
+
+            (name, surname, member_number, status, created_date,
+             months_contributed, total_contributions, avg_contribution,
+             total_loans, total_borrowed, outstanding_balance,
+             total_repaid, total_interest_paid, overdue_loans_count) = member_info
+
+            # Calculate standing score (0-100) via the numeric kernel
+            expected_contributions = float(self.config_manager.get_config_value_cached('monthly_contribution_amount', 100)) * 12
+            standing_score, contribution_rate = _standing_score_kernel(
+                overdue_loans_count, float(total_contributions),
+                expected_contributions, float(total_borrowed), float(total_repaid))
             
             # Determine standing category
-            if standing_score >= 90:
-                standing_category = "Excellent"
-            elif standing_score >= 75:
-                standing_category = "Good"
-            elif standing_score >= 60:
-                standing_category = "Fair"
-            else:
-                standing_category = "Poor"
+            standing_category = _standing_category(standing_score)
             
             conn.close()
             
@@ -7326,7 +7716,7 @@ class MemberAnalyzer:
                 'outstanding_balance': outstanding_balance,
                 'total_repaid': total_repaid,
                 'total_interest_paid': total_interest_paid,
-                'overdue_loans_count': len(overdue_loans),
+                'overdue_loans_count': overdue_loans_count,
                 'standing_score': round(standing_score, 1),
                 'standing_category': standing_category,
                 'contribution_rate': round(contribution_rate * 100, 1)
@@ -7343,10 +7733,18 @@ class SessionManager:
     
     def __init__(self):
         self.session_start_time = None
-        self.last_activity_time = None
+        # Monotonic float stamp; cheaper than a datetime per UI event and
+        # immune to wall-clock adjustments
+        self.last_activity_monotonic = None
         self.current_user = None
         self.idle_timeout_minutes = 30  # Default 30 minutes
-        self.security_violations = []
+        self._timeout_seconds = self.idle_timeout_minutes * 60
+        # Bounded so a long-running session can't grow this without limit;
+        # the audit trail keeps the full history
+        self.security_violations = deque(maxlen=500)
+        # LOGIN/LOGOUT audit writes queued here and flushed together at
+        # session end, keeping the login path free of audit I/O
+        self._audit_queue = []
     
     def start_session(self, username: str) -> dict:
         """
@@ -7360,19 +7758,21 @@ class SessionManager:
         """
         try:
             self.session_start_time = datetime.now()
-            self.last_activity_time = datetime.now()
+            self.last_activity_monotonic = time.monotonic()
             self.current_user = username
             
             # Get timeout from config
             config_manager = SystemConfigManager()
             self.idle_timeout_minutes = int(config_manager.get_config_value('session_timeout_minutes', 30))
+            # Converted once here; check_session_timeout runs on a timer
+            self._timeout_seconds = self.idle_timeout_minutes * 60
             
-            # Log session start
-            audit_manager.log_action(
+            # Queue session start for the end-of-session audit flush
+            self._audit_queue.append((
                 'LOGIN', 'Session', 0,
                 f"Session started for user {username}",
                 {'session_start': self.session_start_time.isoformat()}
-            )
+            ))
             
             return {
                 'success': True,
@@ -7384,32 +7784,39 @@ class SessionManager:
             return ErrorHandler.handle_error(e, "session start")
     
     def update_activity(self):
-        """Update last activity time"""
-        self.last_activity_time = datetime.now()
-    
+        """Update last activity time (coalesced to 5-second resolution)"""
+        now = time.monotonic()
+        # High-frequency Tk events (mouse motion, keystrokes, rapid panel
+        # switches) funnel here; anything finer than a few seconds is
+        # noise for a minutes-scale timeout
+        if (self.last_activity_monotonic is not None
+                and now - self.last_activity_monotonic < 5.0):
+            return
+        self.last_activity_monotonic = now
+
     def check_session_timeout(self) -> dict:
         """
         Check if session has timed out
-        
+
         Returns:
             dict: Timeout check result
         """
-        if not self.last_activity_time:
+        if self.last_activity_monotonic is None:
             return {'timed_out': False, 'message': 'No active session'}
-        
-        time_since_activity = datetime.now() - self.last_activity_time
-        timeout_threshold = timedelta(minutes=self.idle_timeout_minutes)
-        
-        if time_since_activity > timeout_threshold:
+
+        seconds_since_activity = time.monotonic() - self.last_activity_monotonic
+        timeout_seconds = self._timeout_seconds
+
+        if seconds_since_activity > timeout_seconds:
             self.end_session('timeout')
             return {
                 'timed_out': True,
                 'message': f'Session timed out after {self.idle_timeout_minutes} minutes of inactivity'
             }
-        
+
         return {
             'timed_out': False,
-            'remaining_minutes': int((timeout_threshold - time_since_activity).total_seconds() / 60)
+            'remaining_minutes': int((timeout_seconds - seconds_since_activity) / 60)
         }
     
     def end_session(self, reason: str = 'logout'):
@@ -7420,19 +7827,26 @@ class SessionManager:
             reason (str): Reason for ending session
         """
         if self.current_user:
-            # Log session end
-            audit_manager.log_action(
+            # Queue session end, then flush the whole session's events
+            self._audit_queue.append((
                 'LOGOUT', 'Session', 0,
                 f"Session ended for user {self.current_user} - {reason}",
                 {
                     'session_duration': str(datetime.now() - self.session_start_time) if self.session_start_time else 'unknown',
                     'end_reason': reason
                 }
-            )
-        
+            ))
+        self._flush_audit_queue()
+
         self.session_start_time = None
-        self.last_activity_time = None
+        self.last_activity_monotonic = None
         self.current_user = None
+
+    def _flush_audit_queue(self):
+        """Write queued session audit events in one pass"""
+        queued, self._audit_queue = self._audit_queue, []
+        for event in queued:
+            audit_manager.log_action(*event)
     
     def log_security_violation(self, violation_type: str, details: dict):
         """
@@ -7464,7 +7878,20 @@ class AccessibleDialog:
     Base class for all member dialogs with consistent accessibility features
     Provides standardized layout, keyboard navigation, and accessibility support
     """
-    
+
+    # Shared palette: built once for all dialog instances and read-only
+    COLORS = MappingProxyType({
+        'primary': '#2E86AB',
+        'secondary': '#A23B72',
+        'success': '#F18F01',
+        'danger': '#C73E1D',
+        'light': '#F5F5F5',
+        'dark': '#333333',
+        'white': '#FFFFFF',
+        'focus': '#4A90E2',
+        'disabled': '#CCCCCC'
+    })
+
     def __init__(self, parent, title, width=600, height=500):
         self.parent = parent
         self.title = title
@@ -7474,6 +7901,7 @@ class AccessibleDialog:
         
         # Accessibility state
         self.focus_order = []
+        self._focus_index = {}  # widget -> position, for O(1) Tab lookup
         self.current_focus_index = 0
         
         # Create dialog window
@@ -7500,9 +7928,34 @@ class AccessibleDialog:
         
         # Set modal
         self.dialog.grab_set()
-        
+
+        # Timers created through _schedule are cancelled when the dialog
+        # goes away, so no callback ever fires against dead widgets
+        self._pending_afters = set()
+        self.dialog.bind('<Destroy>', self._cancel_pending_afters, add='+')
+
         # Set initial focus
         self.dialog.after(100, self.set_initial_focus)
+
+    def _schedule(self, ms, fn):
+        """after() wrapper whose timers die with the dialog"""
+        def _run(aid=None):
+            self._pending_afters.discard(aid)
+            fn()
+        aid = self.dialog.after(ms, lambda: _run(aid))
+        self._pending_afters.add(aid)
+        return aid
+
+    def _cancel_pending_afters(self, event=None):
+        """Cancel all outstanding _schedule timers on dialog destroy"""
+        if event is not None and event.widget is not self.dialog:
+            return
+        for aid in self._pending_afters:
+            try:
+                self.dialog.after_cancel(aid)
+            except tk.TclError:
+                pass
+        self._pending_afters.clear()
     
     def setup_accessibility_attributes(self):
         """Setup accessibility attributes for screen readers"""
@@ -7522,70 +7975,75 @@ class AccessibleDialog:
         
         # Create live region for status announcements
         self.live_region = None
+        self._aria_toggle = 0
     
+    # Screen dimensions queried once and shared by all dialogs; they only
+    # change on a display reconfiguration, not between dialog opens
+    _screen_wh = None
+
     def center_dialog(self):
         """Center the dialog on the parent window"""
         self.dialog.update_idletasks()
-        
+
         # Get parent window position and size
         parent_x = self.parent.winfo_rootx()
         parent_y = self.parent.winfo_rooty()
         parent_width = self.parent.winfo_width()
         parent_height = self.parent.winfo_height()
-        
+
         # Calculate center position
         x = parent_x + (parent_width - self.width) // 2
         y = parent_y + (parent_height - self.height) // 2
-        
+
         # Ensure dialog stays on screen
-        x = max(0, min(x, self.dialog.winfo_screenwidth() - self.width))
-        y = max(0, min(y, self.dialog.winfo_screenheight() - self.height))
-        
+        if AccessibleDialog._screen_wh is None:
+            AccessibleDialog._screen_wh = (self.dialog.winfo_screenwidth(),
+                                           self.dialog.winfo_screenheight())
+        screen_width, screen_height = AccessibleDialog._screen_wh
+        x = max(0, min(x, screen_width - self.width))
+        y = max(0, min(y, screen_height - self.height))
+
         self.dialog.geometry(f"+{x}+{y}")
     
     def configure_style(self):
         """Configure consistent dialog styling"""
-        self.colors = {
-            'primary': '#2E86AB',
-            'secondary': '#A23B72', 
-            'success': '#F18F01',
-            'danger': '#C73E1D',
-            'light': '#F5F5F5',
-            'dark': '#333333',
-            'white': '#FFFFFF',
-            'focus': '#4A90E2',
-            'disabled': '#CCCCCC'
-        }
-        
+        # Alias the shared class palette; no per-instance dict build
+        self.colors = self.COLORS
+
         self.dialog.configure(bg=self.colors['light'])
     
     def create_base_layout(self):
         """Create standardized dialog layout with button bar at top"""
-        # Main container
+        # Main container. The four skeleton rows are laid out with grid,
+        # configured once, so adding widgets doesn't trigger the repack
+        # cascades pack causes; subclasses still use pack inside
+        # content_frame
         self.main_frame = tk.Frame(self.dialog, bg=self.colors['light'], padx=20, pady=15)
         self.main_frame.pack(fill='both', expand=True)
-        
+        self.main_frame.grid_rowconfigure(2, weight=1)
+        self.main_frame.grid_columnconfigure(0, weight=1)
+
         # Top button bar (standardized position)
         self.create_button_bar()
-        
+
         # Separator
         separator = tk.Frame(self.main_frame, height=2, bg=self.colors['primary'])
-        separator.pack(fill='x', pady=(0, 15))
-        
+        separator.grid(row=1, column=0, sticky='ew', pady=(0, 15))
+
         # Content area (to be implemented by subclasses)
         self.content_frame = tk.Frame(self.main_frame, bg=self.colors['light'])
-        self.content_frame.pack(fill='both', expand=True, pady=(0, 15))
-        
+        self.content_frame.grid(row=2, column=0, sticky='nsew', pady=(0, 15))
+
         # Status bar at bottom
         self.create_status_bar()
-        
+
         # Create content (implemented by subclasses)
         self.create_content()
     
     def create_button_bar(self):
         """Create standardized button bar at top of dialog"""
         self.button_frame = tk.Frame(self.main_frame, bg=self.colors['light'])
-        self.button_frame.pack(fill='x', pady=(0, 10))
+        self.button_frame.grid(row=0, column=0, sticky='ew', pady=(0, 10))
         
         # Help button (left side)
         self.help_btn = tk.Button(
@@ -7665,62 +8123,81 @@ class AccessibleDialog:
             button.bind('<Return>', lambda e, btn=button: btn.invoke())
             button.bind('<space>', lambda e, btn=button: btn.invoke())
     
-    def create_tooltip(self, widget, text):
-        """Create tooltip for accessibility"""
-        def show_tooltip(event):
-            tooltip = tk.Toplevel()
-            tooltip.wm_overrideredirect(True)
-            tooltip.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
-            
-            label = tk.Label(
-                tooltip,
-                text=text,
+    def _get_tooltip_window(self):
+        """Lazily create the dialog's single shared tooltip window"""
+        if getattr(self, '_tooltip', None) is None:
+            self._tooltip = tk.Toplevel(self.dialog)
+            self._tooltip.wm_overrideredirect(True)
+            self._tooltip.withdraw()
+            self._tooltip_label = tk.Label(
+                self._tooltip,
+                text='',
                 background='#FFFFDD',
                 relief='solid',
                 borderwidth=1,
-                font=('Arial', 9)
+                font=('Arial', 9),
+                justify='left',
+                wraplength=300
             )
-            label.pack()
-            
-            # Auto-hide after 3 seconds
-            tooltip.after(3000, tooltip.destroy)
-            
-            # Store reference to prevent garbage collection
-            widget.tooltip = tooltip
-        
+            self._tooltip_label.pack()
+            # Secondary line for input-assistance examples; hidden until
+            # a caller supplies examples text
+            self._tooltip_examples = tk.Label(
+                self._tooltip,
+                text='',
+                background='#FFFFDD',
+                font=('Arial', 8),
+                justify='left',
+                fg='#666666'
+            )
+            self._tooltip_after_id = None
+        return self._tooltip
+
+    def create_tooltip(self, widget, text):
+        """Create tooltip for accessibility"""
+        # All tooltips share one Toplevel that is repositioned and
+        # reconfigured on hover instead of being created/destroyed per event
+        def show_tooltip(event):
+            tooltip = self._get_tooltip_window()
+            self._tooltip_label.configure(text=text)
+            tooltip.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
+            tooltip.deiconify()
+
         def hide_tooltip(event):
-            if hasattr(widget, 'tooltip'):
-                try:
-                    widget.tooltip.destroy()
-                except:
-                    pass
-        
+            if getattr(self, '_tooltip', None) is not None:
+                self._tooltip.withdraw()
+
         widget.bind('<Enter>', show_tooltip)
         widget.bind('<Leave>', hide_tooltip)
     
+    # Focus highlight options, built once; each focus event is then a
+    # single configure call with no per-event dict construction. (ttk
+    # styles would batch this further but drop the tk bg/fg options the
+    # dialog design depends on.)
+    _FOCUS_IN_OPTS = {
+        'highlightthickness': 3,
+        'highlightcolor': COLORS['focus'],
+        'highlightbackground': COLORS['focus']
+    }
+    _FOCUS_OUT_OPTS = {
+        'highlightthickness': 1,
+        'highlightcolor': COLORS['light'],
+        'highlightbackground': COLORS['light']
+    }
+
     def on_button_focus_in(self, event):
         """Handle button focus in - add visual focus indicator"""
-        button = event.widget
-        button.configure(
-            highlightthickness=3,
-            highlightcolor=self.colors['focus'],
-            highlightbackground=self.colors['focus']
-        )
-    
+        event.widget.configure(self._FOCUS_IN_OPTS)
+
     def on_button_focus_out(self, event):
         """Handle button focus out - remove visual focus indicator"""
-        button = event.widget
-        button.configure(
-            highlightthickness=1,
-            highlightcolor=self.colors['light'],
-            highlightbackground=self.colors['light']
-        )
+        event.widget.configure(self._FOCUS_OUT_OPTS)
     
     def create_status_bar(self):
         """Create status bar for user feedback with live region support"""
         self.status_frame = tk.Frame(self.main_frame, bg=self.colors['light'], height=25)
-        self.status_frame.pack(fill='x', side='bottom')
-        self.status_frame.pack_propagate(False)
+        self.status_frame.grid(row=3, column=0, sticky='ew')
+        self.status_frame.grid_propagate(False)
         
         self.status_label = tk.Label(
             self.status_frame,
@@ -7753,23 +8230,27 @@ class AccessibleDialog:
     def announce_to_screen_reader(self, message):
         """Announce message to screen readers via live region"""
         if self.live_region:
-            self.live_region.configure(text=message)
-            # Clear after a short delay to allow for re-announcement of same message
-            self.dialog.after(100, lambda: self.live_region.configure(text=""))
+            # Alternate a trailing zero-width space so repeating the same
+            # message still changes the label text and is re-announced,
+            # without scheduling a timer to clear and redraw the region
+            self._aria_toggle ^= 1
+            self.live_region.configure(
+                text=message + ('\u200b' if self._aria_toggle else ''))
     
+    # Alt shortcut dispatch table, shared by all dialogs; keysyms are
+    # lowercased on lookup so one binding covers both cases
+    _ALT_SHORTCUTS = {'o': 'ok_action', 'c': 'cancel'}
+
     def setup_keyboard_bindings(self):
         """Setup comprehensive keyboard navigation and shortcuts"""
-        # Primary shortcuts
+        # Primary shortcuts (bound methods — no closure per binding)
         self.dialog.bind('<Return>', self.handle_enter_key)
-        self.dialog.bind('<Escape>', lambda e: self.cancel())
-        self.dialog.bind('<F1>', lambda e: self.show_help())
-        
-        # Alt key shortcuts
-        self.dialog.bind('<Alt-o>', lambda e: self.ok_action())
-        self.dialog.bind('<Alt-O>', lambda e: self.ok_action())
-        self.dialog.bind('<Alt-c>', lambda e: self.cancel())
-        self.dialog.bind('<Alt-C>', lambda e: self.cancel())
-        
+        self.dialog.bind('<Escape>', self._on_cancel)
+        self.dialog.bind('<F1>', self._on_help)
+
+        # Alt key shortcuts via a single dispatch binding
+        self.dialog.bind('<Alt-KeyPress>', self._on_alt_key)
+
         # Tab navigation
         self.dialog.bind('<Tab>', self.handle_tab_navigation)
         self.dialog.bind('<Shift-Tab>', self.handle_shift_tab_navigation)
@@ -7783,7 +8264,20 @@ class AccessibleDialog:
         
         # Make dialog focusable
         self.dialog.focus_set()
-    
+
+    def _on_cancel(self, event=None):
+        self.cancel()
+
+    def _on_help(self, event=None):
+        self.show_help()
+
+    def _on_alt_key(self, event):
+        """Dispatch Alt shortcuts through the class-level table"""
+        method_name = self._ALT_SHORTCUTS.get(event.keysym.lower())
+        if method_name:
+            getattr(self, method_name)()
+            return 'break'
+
     def handle_enter_key(self, event):
         """Handle Enter key - context-sensitive action"""
         focused_widget = self.dialog.focus_get()
@@ -7807,13 +8301,13 @@ class AccessibleDialog:
             return
         
         current_widget = self.dialog.focus_get()
-        
-        try:
-            current_index = self.focus_order.index(current_widget)
-            next_index = (current_index + 1) % len(self.focus_order)
-        except ValueError:
+
+        current_index = self._focus_index.get(current_widget)
+        if current_index is None:
             next_index = 0
-        
+        else:
+            next_index = (current_index + 1) % len(self.focus_order)
+
         self.focus_order[next_index].focus_set()
         return 'break'
     
@@ -7823,13 +8317,13 @@ class AccessibleDialog:
             return
         
         current_widget = self.dialog.focus_get()
-        
-        try:
-            current_index = self.focus_order.index(current_widget)
-            prev_index = (current_index - 1) % len(self.focus_order)
-        except ValueError:
+
+        current_index = self._focus_index.get(current_widget)
+        if current_index is None:
             prev_index = len(self.focus_order) - 1
-        
+        else:
+            prev_index = (current_index - 1) % len(self.focus_order)
+
         self.focus_order[prev_index].focus_set()
         return 'break'
     
@@ -7864,7 +8358,8 @@ class AccessibleDialog:
     
     def add_to_focus_order(self, widget):
         """Add widget to focus order for tab navigation"""
-        if widget not in self.focus_order:
+        if widget not in self._focus_index:
+            self._focus_index[widget] = len(self.focus_order)
             self.focus_order.append(widget)
     
     def set_initial_focus(self):
@@ -7872,23 +8367,35 @@ class AccessibleDialog:
         if self.focus_order:
             self.focus_order[0].focus_set()
     
+    _STATUS_COLORS = {
+        'info': COLORS['dark'],
+        'success': COLORS['success'],
+        'error': COLORS['danger'],
+        'warning': COLORS['secondary']
+    }
+
     def update_status(self, message, message_type='info'):
-        """Update status bar with accessibility announcements"""
-        colors = {
-            'info': self.colors['dark'],
-            'success': self.colors['success'],
-            'error': self.colors['danger'],
-            'warning': self.colors['secondary']
-        }
-        
-        color = colors.get(message_type, self.colors['dark'])
+        """Update status bar with accessibility announcements (coalesced)"""
+        # Rapid validation messages can arrive per keystroke; keep only the
+        # latest and flush once per idle cycle instead of thrashing Tk
+        flush_pending = getattr(self, '_pending_status', None) is not None
+        self._pending_status = (message, message_type)
+        if not flush_pending:
+            self.dialog.after_idle(self._flush_status)
+
+    def _flush_status(self):
+        """Write the most recent pending status message to the widgets"""
+        pending = getattr(self, '_pending_status', None)
+        if pending is None:
+            return
+        self._pending_status = None
+
+        message, message_type = pending
+        color = self._STATUS_COLORS.get(message_type, self.colors['dark'])
         self.status_label.configure(text=message, fg=color)
-        
+
         # Announce to screen readers via live region
         self.announce_to_screen_reader(message)
-        
-        # Force update for screen readers
-        self.dialog.update_idletasks()
     
     # Abstract methods to be implemented by subclasses
     def create_content(self):
@@ -7913,10 +8420,9 @@ class AccessibleDialog:
         self.result = False
         self.dialog.destroy()
     
-    def show_help(self):
-        """Show help information - can be overridden by subclasses"""
-        help_text = f"""
-{self.title} Help
+    # Shared help template; only the title varies per dialog, so the body
+    # is built once at class definition instead of per F1 press
+    _HELP_TEMPLATE = """{title} Help
 
 Keyboard Shortcuts:
 • Enter or Alt+O: Confirm action
@@ -7926,10 +8432,12 @@ Keyboard Shortcuts:
 • F1: Show this help
 • Arrow keys: Navigate buttons
 
-This dialog follows accessibility standards for keyboard navigation and screen reader support.
-        """
-        
-        messagebox.showinfo(f"{self.title} - Help", help_text.strip())
+This dialog follows accessibility standards for keyboard navigation and screen reader support."""
+
+    def show_help(self):
+        """Show help information - can be overridden by subclasses"""
+        messagebox.showinfo(f"{self.title} - Help",
+                            self._HELP_TEMPLATE.format(title=self.title))
     
     def create_accessible_form_field(self, parent, label_text, field_type='entry', required=False, **kwargs):
         """
@@ -7989,7 +8497,20 @@ This dialog follows accessibility standards for keyboard navigation and screen r
             widget = tk.Entry(field_frame, **kwargs)
         
         widget.pack(fill='x', ipady=5 if field_type == 'entry' else 0)
-        
+
+        # Pre-pack the field's validation message line while the form is
+        # being built; validation later only changes its text, so the
+        # frame's geometry is never re-run per keystroke
+        widget.error_message_label = tk.Label(
+            field_frame,
+            text="",
+            font=('Arial', 9),
+            bg=self.colors['light'],
+            anchor='w',
+            wraplength=300
+        )
+        widget.error_message_label.pack(fill='x')
+
         # Add to focus order
         self.add_to_focus_order(widget)
         
@@ -8000,9 +8521,10 @@ This dialog follows accessibility standards for keyboard navigation and screen r
     
     def setup_field_accessibility(self, widget, label_text, required=False):
         """Setup accessibility features for form fields"""
-        # Add focus indicators
-        widget.bind('<FocusIn>', self.on_field_focus_in)
-        widget.bind('<FocusOut>', self.on_field_focus_out)
+        # Add focus indicators; add='+' so placeholder/validation/tooltip
+        # handlers on the same events chain instead of replacing this one
+        widget.bind('<FocusIn>', self.on_field_focus_in, add='+')
+        widget.bind('<FocusOut>', self.on_field_focus_out, add='+')
         
         # Add validation feedback placeholder
         widget.validation_status = 'neutral'  # neutral, valid, invalid
@@ -8014,37 +8536,36 @@ This dialog follows accessibility standards for keyboard navigation and screen r
     def on_field_focus_in(self, event):
         """Handle field focus in - add visual focus indicator and announce to screen reader"""
         widget = event.widget
-        
-        # Visual focus indicator
-        if hasattr(widget, 'configure'):
-            try:
-                widget.configure(
-                    highlightthickness=3,
-                    highlightcolor=self.colors['focus']
-                )
-            except tk.TclError:
-                pass  # Some widgets don't support these options
-        
+
+        # Visual focus indicator; the TclError guard already covers
+        # widgets without these options, no hasattr probe needed
+        try:
+            widget.configure(
+                highlightthickness=3,
+                highlightcolor=self.colors['focus']
+            )
+        except tk.TclError:
+            pass  # Some widgets don't support these options
+
         # Announce field to screen reader
-        if hasattr(widget, 'aria_label'):
-            announcement = widget.aria_label
-            if hasattr(widget, 'is_required') and widget.is_required:
+        announcement = getattr(widget, 'aria_label', None)
+        if announcement is not None:
+            if getattr(widget, 'is_required', False):
                 announcement += " - Required field"
             self.announce_to_screen_reader(f"Focused on {announcement}")
-    
+
     def on_field_focus_out(self, event):
         """Handle field focus out - remove visual focus indicator"""
         widget = event.widget
-        
+
         # Remove visual focus indicator
-        if hasattr(widget, 'configure'):
-            try:
-                widget.configure(
-                    highlightthickness=1,
-                    highlightcolor=self.colors['light']
-                )
-            except tk.TclError:
-                pass
+        try:
+            widget.configure(
+                highlightthickness=1,
+                highlightcolor=self.colors['light']
+            )
+        except tk.TclError:
+            pass
     
     def add_validation_indicator(self, widget, status='neutral', message=''):
         """
@@ -8057,6 +8578,9 @@ This dialog follows accessibility standards for keyboard navigation and screen r
         """
         widget.validation_status = status
         widget.validation_message = message
+        # Cached so the submit path can trust results the real-time
+        # validator already produced instead of re-running the checks
+        widget._last_validation = (status, message)
         
         # Color coding for validation status
         colors = {
@@ -8101,146 +8625,153 @@ This dialog follows accessibility standards for keyboard navigation and screen r
             self.announce_to_screen_reader(f"Validation: {message}")
     
     def _add_validation_icon(self, widget, icon_text, color):
-        """Add validation icon next to field"""
-        parent = widget.master
-        
-        # Remove existing icon if present
-        self._remove_validation_icon(widget)
-        
-        # Create validation icon
-        icon_label = tk.Label(
-            parent,
-            text=icon_text,
-            font=('Arial', 12, 'bold'),
-            fg=color,
-            bg=self.colors['light'],
-            width=2
-        )
-        
-        # Position icon to the right of the widget
+        """Show validation icon next to field"""
+        # One persistent label per field, created on first use and then
+        # only reconfigured/re-placed — destroying and recreating widgets
+        # per validation pass churns Tcl commands and geometry
+        icon_label = getattr(widget, 'validation_icon', None)
+        if icon_label is None:
+            icon_label = tk.Label(
+                widget.master,
+                font=('Arial', 12, 'bold'),
+                bg=self.colors['light'],
+                width=2
+            )
+            widget.validation_icon = icon_label
+
+        icon_label.configure(text=icon_text, fg=color)
+        # Position icon at the widget's right edge using relative
+        # placement; no winfo_reqwidth() geometry round trip needed
         icon_label.place(
             in_=widget,
-            x=widget.winfo_reqwidth() + 5,
-            y=2
+            relx=1.0,
+            x=5,
+            y=2,
+            anchor='nw'
         )
-        
-        # Store reference to icon for later removal
-        widget.validation_icon = icon_label
-    
+
+    def _batch_reset_indicators(self, widgets):
+        """Reset several fields to neutral with a single idle flush"""
+        for widget in widgets:
+            self.add_validation_indicator(widget, 'neutral')
+        # One redraw for the whole batch rather than one per field
+        self.dialog.update_idletasks()
+
     def _remove_validation_icon(self, widget):
-        """Remove validation icon from field"""
-        if hasattr(widget, 'validation_icon') and widget.validation_icon:
-            try:
-                widget.validation_icon.destroy()
-            except tk.TclError:
-                pass
-            widget.validation_icon = None
-    
+        """Hide validation icon for field"""
+        icon_label = getattr(widget, 'validation_icon', None)
+        if icon_label is not None:
+            icon_label.place_forget()
+
     def _update_field_error_message(self, widget, message, status):
         """Update field-specific error message below the field"""
-        parent = widget.master
-        
-        # Remove existing error message if present
-        if hasattr(widget, 'error_message_label') and widget.error_message_label:
-            try:
-                widget.error_message_label.destroy()
-            except tk.TclError:
-                pass
-            widget.error_message_label = None
-        
-        # Add error message for invalid fields
-        if status == 'invalid' and message:
+        colors = self.colors
+        error_label = getattr(widget, 'error_message_label', None)
+        if error_label is None:
+            # Fields built outside create_accessible_form_field get their
+            # message line on first validation, packed once and kept
             error_label = tk.Label(
-                parent,
-                text=f"⚠ {message}",
+                widget.master,
+                text="",
                 font=('Arial', 9),
-                fg=self.colors['danger'],
-                bg=self.colors['light'],
+                bg=colors['light'],
                 anchor='w',
                 wraplength=300
             )
-            error_label.pack(fill='x', pady=(2, 5))
+            error_label.pack(fill='x')
             widget.error_message_label = error_label
+
+        if status == 'invalid' and message:
+            error_label.configure(text=f"⚠ {message}", fg=colors['danger'])
         elif status == 'valid' and message:
             # Show success message briefly
-            success_label = tk.Label(
-                parent,
-                text=f"✓ {message}",
-                font=('Arial', 9),
-                fg=self.colors['success'],
-                bg=self.colors['light'],
-                anchor='w'
-            )
-            success_label.pack(fill='x', pady=(2, 5))
-            widget.error_message_label = success_label
-            
+            error_label.configure(text=f"✓ {message}", fg=colors['success'])
             # Auto-hide success message after 3 seconds
-            self.dialog.after(3000, lambda: self._hide_success_message(success_label))
-    
+            self._schedule(3000, lambda: self._hide_success_message(error_label))
+        else:
+            error_label.configure(text="")
+
     def _hide_success_message(self, label):
         """Hide success message after delay"""
         try:
-            label.destroy()
+            label.configure(text="")
         except tk.TclError:
             pass
     
     def create_validation_summary(self, parent):
         """Create validation summary widget for overall form status"""
-        self.validation_summary_frame = tk.Frame(parent, bg=self.colors['light'])
+        colors = self.colors
+        self.validation_summary_frame = tk.Frame(parent, bg=colors['light'])
         self.validation_summary_frame.pack(fill='x', pady=(10, 0))
-        
+
         self.validation_summary_label = tk.Label(
             self.validation_summary_frame,
             text="",
             font=('Arial', 10),
-            bg=self.colors['light'],
-            fg=self.colors['dark'],
+            bg=colors['light'],
+            fg=colors['dark'],
             anchor='w',
             wraplength=400
         )
         self.validation_summary_label.pack(fill='x', padx=5, pady=5)
-        
-        # Initially hidden
-        self.validation_summary_frame.pack_forget()
     
     def update_validation_summary(self, validation_result):
         """Update validation summary based on overall form validation"""
-        if not hasattr(self, 'validation_summary_frame'):
+        if getattr(self, 'validation_summary_frame', None) is None:
             return
-        
+
+        colors = self.colors
         errors = validation_result.get('errors', {})
         warnings = validation_result.get('warnings', {})
         
         if errors:
             # Show errors
             error_count = len(errors)
-            error_text = f"⚠ {error_count} error{'s' if error_count > 1 else ''} found:"
-            for field, message in errors.items():
-                error_text += f"\n• {message}"
-            
+            error_text = (f"⚠ {error_count} error{'s' if error_count > 1 else ''} found:\n"
+                          + "\n".join(f"• {m}" for m in errors.values()))
+
             self.validation_summary_label.configure(
                 text=error_text,
-                fg=self.colors['danger']
+                fg=colors['danger']
             )
-            self.validation_summary_frame.pack(fill='x', pady=(10, 0))
-            
+
         elif warnings:
             # Show warnings
             warning_count = len(warnings)
-            warning_text = f"⚠ {warning_count} warning{'s' if warning_count > 1 else ''} found:"
-            for field, message in warnings.items():
-                warning_text += f"\n• {message}"
-            
+            warning_text = (f"⚠ {warning_count} warning{'s' if warning_count > 1 else ''} found:\n"
+                            + "\n".join(f"• {m}" for m in warnings.values()))
+
             self.validation_summary_label.configure(
                 text=warning_text,
-                fg=self.colors['secondary']
+                fg=colors['secondary']
             )
-            self.validation_summary_frame.pack(fill='x', pady=(10, 0))
-            
+
         else:
-            # Hide summary when no errors or warnings
-            self.validation_summary_frame.pack_forget()
-    
+            # Empty text collapses the label; the frame stays packed so
+            # no geometry pass runs when the summary toggles
+            self.validation_summary_label.configure(text="")
+    
+    def register_key_handler(self, widget, fn):
+        """Subscribe fn to the widget's KeyRelease through one dispatcher
+
+        Several subsystems (validation, phone formatting, dirty
+        tracking) watch typing on the same entry; funnelling them
+        through a single bound dispatcher costs one Tcl-to-Python round
+        trip per keystroke instead of one per subscriber. A handler may
+        return 'break' to stop the chain.
+        """
+        handlers = getattr(widget, '_key_handlers', None)
+        if handlers is None:
+            handlers = widget._key_handlers = []
+
+            def _dispatch(event):
+                for handler in widget._key_handlers:
+                    if handler(event) == 'break':
+                        return 'break'
+
+            widget.bind('<KeyRelease>', _dispatch, add='+')
+        handlers.append(fn)
+
     def add_real_time_validation(self, widget, validation_func, *args, **kwargs):
         """
         Add real-time validation to a widget
@@ -8250,7 +8781,8 @@ This dialog follows accessibility standards for keyboard navigation and screen r
             validation_func: Function to call for validation
             *args, **kwargs: Arguments to pass to validation function
         """
-        def validate_on_change(event=None):
+        def _do_validate():
+            widget._validation_after_id = None
             # Get current value
             if isinstance(widget, tk.Entry):
                 value = widget.get()
@@ -8258,39 +8790,70 @@ This dialog follows accessibility standards for keyboard navigation and screen r
                 value = widget.get('1.0', tk.END).strip()
             else:
                 return
-            
+
+            # Skip when nothing changed since the last run (arrow keys,
+            # Shift etc. fire KeyRelease too) or when the field still
+            # shows its placeholder text, which isn't real input
+            if value == getattr(widget, '_last_validated_value', None):
+                return
+            if value == getattr(widget, '_placeholder_text', None):
+                return
+            widget._last_validated_value = value
+
             # Perform validation
             try:
                 result = validation_func(value, *args, **kwargs)
-                
+
                 if result.get('valid', False):
                     self.add_validation_indicator(widget, 'valid', result.get('message', ''))
                 else:
                     self.add_validation_indicator(widget, 'invalid', result.get('message', ''))
-                    
+
             except Exception as e:
                 self.add_validation_indicator(widget, 'invalid', f"Validation error: {str(e)}")
-        
+
+        def validate_on_change(event=None):
+            # Debounce to the trailing edge: validation (and the widget
+            # recolouring it triggers) runs once the user pauses typing,
+            # not on every keystroke
+            if widget._validation_after_id:
+                widget.after_cancel(widget._validation_after_id)
+            widget._validation_after_id = widget.after(250, _do_validate)
+
+        def validate_now(event=None):
+            # Leaving the field validates synchronously
+            if widget._validation_after_id:
+                widget.after_cancel(widget._validation_after_id)
+            _do_validate()
+
+        widget._validation_after_id = None
+        # Submit paths call this to cancel a pending debounced run and
+        # validate the current value before committing the form
+        widget.flush_validation = validate_now
+
         # Bind validation to appropriate events
-        if isinstance(widget, tk.Entry):
-            widget.bind('<KeyRelease>', validate_on_change)
-            widget.bind('<FocusOut>', validate_on_change)
-        elif isinstance(widget, tk.Text):
-            widget.bind('<KeyRelease>', validate_on_change)
-            widget.bind('<FocusOut>', validate_on_change)
+        if isinstance(widget, (tk.Entry, tk.Text)):
+            self.register_key_handler(widget, validate_on_change)
+            widget.bind('<FocusOut>', validate_now, add='+')
         
         # Store validation function for later use
         widget.validation_func = validation_func
         widget.validation_args = args
         widget.validation_kwargs = kwargs
     
+    # Translation table deleting everything except digits and '+'; one C
+    # call replaces the per-character Python scan of the old generator
+    _PHONE_KEEP = str.maketrans(
+        '', '', ''.join(c for c in map(chr, range(128)) if not (c.isdigit() or c == '+')))
+
     def format_phone_number_input(self, widget):
         """Add phone number formatting assistance to entry widget"""
-        def format_phone(event=None):
+        def format_phone():
+            widget._format_after_id = None
             current_value = widget.get()
-            
+
             # Remove all non-digit characters except +
-            cleaned = ''.join(c for c in current_value if c.isdigit() or c == '+')
+            cleaned = current_value.translate(self._PHONE_KEEP)
             
             # Apply formatting based on length and pattern
             if cleaned.startswith('+265') and len(cleaned) >= 7:
@@ -8313,62 +8876,71 @@ This dialog follows accessibility standards for keyboard navigation and screen r
                         widget.icursor(min(cursor_pos, len(formatted)))
                     except tk.TclError:
                         pass
-        
-        # Bind formatting to key release
-        widget.bind('<KeyRelease>', format_phone)
+
+        def schedule_format(event=None):
+            # Same trailing-edge debounce as real-time validation: the
+            # delete/insert/icursor round trips run once per pause, not
+            # once per keystroke
+            if widget._format_after_id:
+                widget.after_cancel(widget._format_after_id)
+            widget._format_after_id = widget.after(250, format_phone)
+
+        widget._format_after_id = None
+        self.register_key_handler(widget, schedule_format)
     
     def create_input_assistance_tooltip(self, widget, help_text, examples=None):
         """Create input assistance tooltip for form fields"""
+        # Precompute the examples block once instead of per focus-in
+        examples_text = (
+            "Examples:\n" + "\n".join(f"• {ex}" for ex in examples)
+            if examples else None
+        )
+
         def show_help(event):
-            # Create tooltip window
-            tooltip = tk.Toplevel()
-            tooltip.wm_overrideredirect(True)
+            # One shared tooltip window per dialog, repositioned and
+            # retexted on focus instead of a fresh Toplevel per field
+            tooltip = self._get_tooltip_window()
+            self._tooltip_label.configure(text=help_text)
+            if examples_text:
+                self._tooltip_examples.configure(text=examples_text)
+                self._tooltip_examples.pack(padx=5, pady=(0, 5))
+            else:
+                self._tooltip_examples.pack_forget()
             tooltip.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
-            tooltip.configure(bg='#FFFFDD')
-            
-            # Help text
-            help_label = tk.Label(
-                tooltip,
-                text=help_text,
-                background='#FFFFDD',
-                relief='solid',
-                borderwidth=1,
-                font=('Arial', 9),
-                justify='left',
-                wraplength=300
-            )
-            help_label.pack(padx=5, pady=5)
-            
-            # Examples if provided
-            if examples:
-                examples_text = "Examples:\n" + "\n".join(f"• {ex}" for ex in examples)
-                examples_label = tk.Label(
-                    tooltip,
-                    text=examples_text,
-                    background='#FFFFDD',
-                    font=('Arial', 8),
-                    justify='left',
-                    fg='#666666'
-                )
-                examples_label.pack(padx=5, pady=(0, 5))
-            
-            # Auto-hide after 5 seconds
-            tooltip.after(5000, tooltip.destroy)
-            
-            # Store reference
-            widget.help_tooltip = tooltip
-        
+            tooltip.deiconify()
+
+            # Auto-hide after 5 seconds; cancel any earlier timer so
+            # tabbing through fields doesn't pile up callbacks
+            if self._tooltip_after_id:
+                tooltip.after_cancel(self._tooltip_after_id)
+            self._tooltip_after_id = tooltip.after(5000, self._hide_shared_tooltip)
+
         def hide_help(event):
-            if hasattr(widget, 'help_tooltip'):
-                try:
-                    widget.help_tooltip.destroy()
-                except tk.TclError:
-                    pass
-        
+            self._hide_shared_tooltip()
+
         # Bind to focus events
-        widget.bind('<FocusIn>', show_help)
-        widget.bind('<FocusOut>', hide_help)
-    
+        widget.bind('<FocusIn>', show_help, add='+')
+        widget.bind('<FocusOut>', hide_help, add='+')
+
+    def _hide_shared_tooltip(self):
+        """Withdraw the shared tooltip and clear its auto-hide timer"""
+        tooltip = getattr(self, '_tooltip', None)
+        if tooltip is None:
+            return
+        if self._tooltip_after_id:
+            tooltip.after_cancel(self._tooltip_after_id)
+            self._tooltip_after_id = None
+        tooltip.withdraw()
+    
+    # Button styling per type; the palette is fixed at class level, so
+    # these dicts are built once instead of per button
+    _BUTTON_STYLES = {
+        'primary': {'bg': COLORS['primary'], 'fg': COLORS['white'], 'font': ('Arial', 10, 'bold')},
+        'secondary': {'bg': COLORS['secondary'], 'fg': COLORS['white'], 'font': ('Arial', 10)},
+        'danger': {'bg': COLORS['danger'], 'fg': COLORS['white'], 'font': ('Arial', 10)},
+        'normal': {'bg': COLORS['light'], 'fg': COLORS['dark'], 'font': ('Arial', 10)}
+    }
+
     def create_accessible_button(self, parent, text, command, button_type='normal', **kwargs):
         """
         Create an accessible button with proper focus indicators and ARIA attributes
@@ -8380,27 +8952,21 @@ This dialog follows accessibility standards for keyboard navigation and screen r
             button_type: 'primary', 'secondary', 'danger', or 'normal'
             **kwargs: Additional button arguments
         """
-        # Button styling based on type
-        styles = {
-            'primary': {'bg': self.colors['primary'], 'fg': self.colors['white'], 'font': ('Arial', 10, 'bold')},
-            'secondary': {'bg': self.colors['secondary'], 'fg': self.colors['white'], 'font': ('Arial', 10)},
-            'danger': {'bg': self.colors['danger'], 'fg': self.colors['white'], 'font': ('Arial', 10)},
-            'normal': {'bg': self.colors['light'], 'fg': self.colors['dark'], 'font': ('Arial', 10)}
-        }
-        
-        style = styles.get(button_type, styles['normal'])
-        
+        style = self._BUTTON_STYLES.get(button_type, self._BUTTON_STYLES['normal'])
+        padx = kwargs.pop('padx', 20)
+        pady = kwargs.pop('pady', 5)
+
         button = tk.Button(
             parent,
             text=text,
             command=command,
-            relief='flat' if button_type in ['primary', 'secondary', 'danger'] else 'solid',
+            relief='flat' if button_type in ('primary', 'secondary', 'danger') else 'solid',
             borderwidth=1,
-            padx=kwargs.get('padx', 20),
-            pady=kwargs.get('pady', 5),
+            padx=padx,
+            pady=pady,
             cursor='hand2',
             **style,
-            **{k: v for k, v in kwargs.items() if k not in ['padx', 'pady']}
+            **kwargs
         )
         
         # Add to focus order
@@ -8420,6 +8986,9 @@ class AddMemberDialog(AccessibleDialog):
     
     def __init__(self, parent, app):
         self.app = app
+        # Set before the base __init__ builds the form, so cancel can
+        # always read it; flipped by the first keystroke in any field
+        self._dirty = False
         # Initialize the base class with appropriate title and size
         super().__init__(parent, "Add New Member", width=550, height=650)
         
@@ -8436,13 +9005,16 @@ class AddMemberDialog(AccessibleDialog):
     
     def create_form_sections(self):
         """Create form sections with accessible fields"""
+        colors = self.colors
+        light, dark = colors['light'], colors['dark']
+
         # Personal Information Section
         personal_section = tk.LabelFrame(
             self.content_frame,
             text="Personal Information",
             font=('Arial', 12, 'bold'),
-            bg=self.colors['light'],
-            fg=self.colors['dark'],
+            bg=light,
+            fg=dark,
             padx=15,
             pady=10
         )
@@ -8463,8 +9035,8 @@ class AddMemberDialog(AccessibleDialog):
             self.content_frame,
             text="Contact Information",
             font=('Arial', 12, 'bold'),
-            bg=self.colors['light'],
-            fg=self.colors['dark'],
+            bg=light,
+            fg=dark,
             padx=15,
             pady=10
         )
@@ -8487,8 +9059,8 @@ class AddMemberDialog(AccessibleDialog):
             self.content_frame,
             text="Additional Information",
             font=('Arial', 12, 'bold'),
-            bg=self.colors['light'],
-            fg=self.colors['dark'],
+            bg=light,
+            fg=dark,
             padx=15,
             pady=10
         )
@@ -8507,58 +9079,85 @@ class AddMemberDialog(AccessibleDialog):
         
         # Add placeholder for notes
         self.notes_text.insert('1.0', "Optional: Any additional notes about the member...")
-        self.notes_text.bind('<FocusIn>', self.clear_notes_placeholder)
-        self.notes_text.bind('<FocusOut>', self.restore_notes_placeholder)
+        self.notes_text._is_placeholder = True
+        self.notes_text.bind('<FocusIn>', self.clear_notes_placeholder, add='+')
+        self.notes_text.bind('<FocusOut>', self.restore_notes_placeholder, add='+')
         
         # Add Clear Form button to the existing button bar
         self.clear_btn = self.create_accessible_button(
             self.button_frame, "Clear Form", self.clear_form, 'secondary'
         )
         self.clear_btn.pack(side='left')
+
+        # Any typing marks the form dirty; cancel checks this flag
+        # instead of re-reading every field
+        for field in (self.name_entry, self.surname_entry, self.phone_entry,
+                      self.email_entry, self.address_entry, self.notes_text):
+            self.register_key_handler(field, self._mark_dirty)
+
+    def _mark_dirty(self, event=None):
+        self._dirty = True
     
     def add_placeholder(self, entry, placeholder_text):
         """Add placeholder functionality to entry widget"""
         entry.insert(0, placeholder_text)
         entry.configure(fg='gray')
-        
+        entry._placeholder_text = placeholder_text
+        # Tracked as a flag so readers never have to compare the text
+        # against the placeholder literal (which also broke if a user
+        # typed the placeholder verbatim)
+        entry._is_placeholder = True
+
         def on_focus_in(event):
-            if entry.get() == placeholder_text:
+            if entry._is_placeholder:
                 entry.delete(0, tk.END)
                 entry.configure(fg='black')
-        
+                entry._is_placeholder = False
+
         def on_focus_out(event):
             if not entry.get():
                 entry.insert(0, placeholder_text)
                 entry.configure(fg='gray')
+                entry._is_placeholder = True
         
-        entry.bind('<FocusIn>', on_focus_in)
-        entry.bind('<FocusOut>', on_focus_out)
+        entry.bind('<FocusIn>', on_focus_in, add='+')
+        entry.bind('<FocusOut>', on_focus_out, add='+')
+
+    def _restore_placeholder(self, entry):
+        """Show an entry's placeholder again without re-binding handlers"""
+        entry.insert(0, entry._placeholder_text)
+        entry.configure(fg='gray')
+        entry._is_placeholder = True
     
     def clear_notes_placeholder(self, event):
         """Clear notes placeholder text"""
-        if self.notes_text.get('1.0', tk.END).strip() == "Optional: Any additional notes about the member...":
+        if getattr(self.notes_text, '_is_placeholder', False):
             self.notes_text.delete('1.0', tk.END)
-    
+            self.notes_text._is_placeholder = False
+
     def restore_notes_placeholder(self, event):
         """Restore notes placeholder if empty"""
         if not self.notes_text.get('1.0', tk.END).strip():
             self.notes_text.insert('1.0', "Optional: Any additional notes about the member...")
-    
+            self.notes_text._is_placeholder = True
+
     def get_form_data(self):
         """Get form data with placeholder handling"""
-        def get_entry_value(entry, placeholder=""):
-            value = entry.get().strip()
-            return value if value != placeholder else ""
-        
+        def get_entry_value(entry):
+            if getattr(entry, '_is_placeholder', False):
+                return ""
+            return entry.get().strip()
+
         name = get_entry_value(self.name_entry)
         surname = get_entry_value(self.surname_entry)
-        phone = get_entry_value(self.phone_entry, "e.g., +265 999 123 456")
-        email = get_entry_value(self.email_entry, "e.g., member@example.com")
-        address = get_entry_value(self.address_entry, "Optional: Physical address")
-        
-        notes = self.notes_text.get('1.0', tk.END).strip()
-        if notes == "Optional: Any additional notes about the member...":
+        phone = get_entry_value(self.phone_entry)
+        email = get_entry_value(self.email_entry)
+        address = get_entry_value(self.address_entry)
+
+        if getattr(self.notes_text, '_is_placeholder', False):
             notes = ""
+        else:
+            notes = self.notes_text.get('1.0', tk.END).strip()
         
         return {
             'name': name,
@@ -8569,56 +9168,69 @@ class AddMemberDialog(AccessibleDialog):
             'notes': notes or None
         }
     
+    @staticmethod
+    def _check_name(value):
+        if not value:
+            return ('invalid', "First name is required")
+        if len(value) < 2:
+            return ('invalid', "First name must be at least 2 characters")
+        return ('valid', "Valid first name")
+
+    @staticmethod
+    def _check_surname(value):
+        if not value:
+            return ('invalid', "Last name is required")
+        if len(value) < 2:
+            return ('invalid', "Last name must be at least 2 characters")
+        return ('valid', "Valid last name")
+
+    @staticmethod
+    def _check_phone(value):
+        if not value:
+            return ('invalid', "Phone number is required")
+        if len(value) < 8:
+            return ('invalid', "Phone number must be at least 8 characters")
+        return ('valid', "Valid phone number")
+
+    @staticmethod
+    def _check_email(value):
+        if not value:
+            return ('neutral', "")
+        if not _EMAIL_RE.match(value):
+            return ('invalid', "Please enter a valid email address")
+        return ('valid', "Valid email address")
+
     def validate_form_data(self, data):
-        """Enhanced form validation with visual feedback"""
+        """Enhanced form validation with visual feedback
+
+        Debounced validation only governs keystroke feedback; the
+        commit path flushes any pending timer and re-checks every field
+        whose cached verdict was not computed for the value the field
+        holds right now, so submitting inside the debounce window never
+        trusts a stale result.
+        """
         errors = []
-        
-        # Reset all validation indicators
-        self.add_validation_indicator(self.name_entry, 'neutral')
-        self.add_validation_indicator(self.surname_entry, 'neutral')
-        self.add_validation_indicator(self.phone_entry, 'neutral')
-        self.add_validation_indicator(self.email_entry, 'neutral')
-        
-        # Required field validation
-        if not data['name']:
-            errors.append("First name is required")
-            self.add_validation_indicator(self.name_entry, 'invalid', "First name is required")
-        elif len(data['name']) < 2:
-            errors.append("First name must be at least 2 characters")
-            self.add_validation_indicator(self.name_entry, 'invalid', "Must be at least 2 characters")
-        else:
-            self.add_validation_indicator(self.name_entry, 'valid', "Valid first name")
-        
-        if not data['surname']:
-            errors.append("Last name is required")
-            self.add_validation_indicator(self.surname_entry, 'invalid', "Last name is required")
-        elif len(data['surname']) < 2:
-            errors.append("Last name must be at least 2 characters")
-            self.add_validation_indicator(self.surname_entry, 'invalid', "Must be at least 2 characters")
-        else:
-            self.add_validation_indicator(self.surname_entry, 'valid', "Valid last name")
-        
-        if not data['phone']:
-            errors.append("Phone number is required")
-            self.add_validation_indicator(self.phone_entry, 'invalid', "Phone number is required")
-        elif len(data['phone']) < 8:
-            errors.append("Phone number must be at least 8 characters")
-            self.add_validation_indicator(self.phone_entry, 'invalid', "Must be at least 8 characters")
-        else:
-            self.add_validation_indicator(self.phone_entry, 'valid', "Valid phone number")
-        
-        # Email validation (if provided)
-        if data['email']:
-            import re
-            email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-            if not re.match(email_pattern, data['email']):
-                errors.append("Please enter a valid email address")
-                self.add_validation_indicator(self.email_entry, 'invalid', "Invalid email format")
-            else:
-                self.add_validation_indicator(self.email_entry, 'valid', "Valid email address")
-        else:
-            self.add_validation_indicator(self.email_entry, 'neutral')
-        
+
+        checks = (
+            (self.name_entry, data['name'], self._check_name),
+            (self.surname_entry, data['surname'], self._check_surname),
+            (self.phone_entry, data['phone'], self._check_phone),
+            (self.email_entry, data['email'], self._check_email),
+        )
+        for widget, value, check in checks:
+            # Cancel any pending debounced run and validate the field's
+            # current content synchronously
+            flush = getattr(widget, 'flush_validation', None)
+            if flush is not None:
+                flush()
+            status, message = getattr(widget, '_last_validation', ('neutral', ''))
+            if status == 'neutral' or getattr(widget, '_last_validated_value', None) != value:
+                status, message = check(value)
+                widget._last_validated_value = value
+                self.add_validation_indicator(widget, status, message)
+            if status == 'invalid':
+                errors.append(message)
+
         return errors
     
     def clear_form(self):
@@ -8631,18 +9243,19 @@ class AddMemberDialog(AccessibleDialog):
         self.notes_text.delete('1.0', tk.END)
         
         # Reset validation indicators
-        self.add_validation_indicator(self.name_entry, 'neutral')
-        self.add_validation_indicator(self.surname_entry, 'neutral')
-        self.add_validation_indicator(self.phone_entry, 'neutral')
-        self.add_validation_indicator(self.email_entry, 'neutral')
-        
-        # Restore placeholders
-        self.add_placeholder(self.phone_entry, "e.g., +265 999 123 456")
-        self.add_placeholder(self.email_entry, "e.g., member@example.com")
-        self.add_placeholder(self.address_entry, "Optional: Physical address")
+        self._batch_reset_indicators(
+            [self.name_entry, self.surname_entry, self.phone_entry, self.email_entry])
+
+        # Restore placeholders; add_placeholder would bind a second set
+        # of focus handlers each time the form is cleared
+        self._restore_placeholder(self.phone_entry)
+        self._restore_placeholder(self.email_entry)
+        self._restore_placeholder(self.address_entry)
         self.notes_text.insert('1.0', "Optional: Any additional notes about the member...")
+        self.notes_text._is_placeholder = True
         
         # Focus on first field
+        self._dirty = False
         self.name_entry.focus()
         self.update_status("Form cleared - ready for new member", 'info')
     
@@ -8680,38 +9293,56 @@ class AddMemberDialog(AccessibleDialog):
                 pass
             
             self.update_status("Creating member record...", 'info')
-            
-            # Create member
-            member_id = create_member(
-                data['name'], 
-                data['surname'], 
-                data['phone'], 
+
+            # Run the database call on a worker thread so the dialog
+            # stays responsive; the result is picked up on the main
+            # thread via after() polling — no Tk calls off-thread
+            self.ok_btn.configure(state='disabled')
+            future = _db_executor.submit(
+                create_member,
+                data['name'],
+                data['surname'],
+                data['phone'],
                 data['email']
             )
-            
-            if member_id:
-                success_message = f"Member '{data['name']} {data['surname']}' added successfully!\nMember ID: {member_id}"
-                messagebox.showinfo("Success", success_message)
-                self.result = True
-                self.update_status("Member created successfully!", 'success')
-                
-                # Close dialog after short delay
-                self.dialog.after(1000, self.dialog.destroy)
-            else:
-                messagebox.showerror("Error", "Failed to add member. Please try again.")
-                self.update_status("Failed to create member", 'error')
-                
+            self._schedule(50, lambda: self._check_create_member_future(future, data))
+
         except Exception as e:
             error_info = ErrorHandler.handle_error(e, "adding member")
             messagebox.showerror("Error", error_info['message'])
             self.update_status("Error occurred while adding member", 'error')
+
+    def _check_create_member_future(self, future, data):
+        """Poll the pending create_member call and finish on completion"""
+        if not future.done():
+            self._schedule(50, lambda: self._check_create_member_future(future, data))
+            return
+
+        self.ok_btn.configure(state='normal')
+        try:
+            member_id = future.result()
+        except Exception as e:
+            error_info = ErrorHandler.handle_error(e, "adding member")
+            messagebox.showerror("Error", error_info['message'])
+            self.update_status("Error occurred while adding member", 'error')
+            return
+
+        if member_id:
+            success_message = f"Member '{data['name']} {data['surname']}' added successfully!\nMember ID: {member_id}"
+            messagebox.showinfo("Success", success_message)
+            self.result = True
+            self._dirty = False
+            self.update_status("Member created successfully!", 'success')
+
+            # Close dialog after short delay
+            self._schedule(1000, self.dialog.destroy)
+        else:
+            messagebox.showerror("Error", "Failed to add member. Please try again.")
+            self.update_status("Failed to create member", 'error')
     
     def cancel(self):
         """Cancel dialog with confirmation if form has data"""
-        data = self.get_form_data()
-        has_data = any([data['name'], data['surname'], data['phone'], data['email'], data['address'], data['notes']])
-        
-        if has_data:
+        if self._dirty:
             if messagebox.askyesno("Confirm Cancel", "You have unsaved changes. Are you sure you want to cancel?"):
                 self.result = False
                 self.dialog.destroy()
@@ -8779,63 +9410,110 @@ class MemberDetailsDialog:
         self.dialog.after(100, lambda: self.dialog.grab_set())
         
     def load_member_data(self):
-        """Load member data from database"""
+        """Load basic member data; history is fetched when its tab opens"""
         try:
-            self.member_data = get_member_profile(self.member_id)
+            self.member_data = get_member_profile(self.member_id, include_history=False)
+            self._history_loaded = False
+            self._totals_cache = None
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load member data: {ErrorHandler.get_user_friendly_message(e)}")
             self.dialog.destroy()
             return
-    
+
+    def _ensure_history(self):
+        """Fetch contribution/loan history once, on first tab that needs it"""
+        if not self._history_loaded:
+            contributions = read_contributions_for_member(self.member_id)
+            # Coerce and format each row once here; the tabs and the
+            # printed statement reuse the precomputed values instead of
+            # repeating float()/format per consumer
+            for c in contributions:
+                c['_amount'] = float(c.get('amount', 0))
+                c['_late_fee'] = float(c.get('late_fee') or 0)
+                c['_amount_str'] = _fmt_mwk(c['_amount'])
+                c['_late_fee_str'] = _fmt_mwk(c['_late_fee'])
+            self.member_data['contributions'] = contributions
+            for l in self.member_data.get('loans', []):
+                l['_amount'] = float(l.get('loan_amount') or 0)
+                l['_outstanding'] = float(l.get('outstanding_balance') or 0)
+                l['_rate'] = float(l.get('interest_rate') or 0)
+            self._history_loaded = True
+            self._totals_cache = None
+
+    def _totals(self):
+        """Contribution/loan totals, computed once per loaded history
+
+        Every tab (and the printed statement) needs some subset of these,
+        so they are summed in a single pass and cached until the member
+        data is reloaded.
+        """
+        if self._totals_cache is None:
+            total_contributions = sum(
+                c['_amount'] for c in self.member_data.get('contributions', []))
+            total_loans = 0.0
+            total_outstanding = 0.0
+            for loan in self.member_data.get('loans', []):
+                total_loans += loan['_amount']
+                total_outstanding += loan['_outstanding']
+            self._totals_cache = (total_contributions, total_loans, total_outstanding)
+        return self._totals_cache
+
+    def _standing(self):
+        """Member standing (label, colour), derived from the cached totals"""
+        total_contributions, _, total_outstanding = self._totals()
+        if total_outstanding > 0:
+            return 'Borrower', 'orange'
+        if total_contributions > 0:
+            return 'Good Standing', 'green'
+        return 'New Member', 'blue'
+
     def create_widgets(self):
         """Create dialog widgets"""
         if not self.member_data:
             return
-            
-        # Create notebook for tabs
-        notebook = ttk.Notebook(self.dialog)
-        notebook.pack(fill='both', expand=True, padx=10, pady=10)
-        
-        # Personal Info Tab
-        self.create_personal_info_tab(notebook)
-        
-        # Contributions Tab
-        self.create_contributions_tab(notebook)
-        
-        # Loans Tab
-        self.create_loans_tab(notebook)
-        
-        # Summary Tab
-        self.create_summary_tab(notebook)
-        
+
+        # Create notebook for tabs. Only the visible Personal Info tab
+        # is built up front; the others get empty frames and are filled
+        # in on first selection, so open time doesn't scale with the
+        # member's history
+        self.notebook = ttk.Notebook(self.dialog)
+        self.notebook.pack(fill='both', expand=True, padx=10, pady=10)
+
+        personal_frame = ttk.Frame(self.notebook)
+        self.notebook.add(personal_frame, text="Personal Info")
+        self.create_personal_info_tab(personal_frame)
+
+        self._tab_builders = {}
+        for text, builder in (("Contributions", self.create_contributions_tab),
+                              ("Loans", self.create_loans_tab),
+                              ("Summary", self.create_summary_tab)):
+            frame = ttk.Frame(self.notebook)
+            self.notebook.add(frame, text=text)
+            self._tab_builders[str(frame)] = (builder, frame)
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+
         # Buttons frame
         button_frame = ttk.Frame(self.dialog)
         button_frame.pack(fill='x', padx=10, pady=(0, 10))
-        
+
         ttk.Button(button_frame, text="Close", command=self.close_dialog).pack(side='right', padx=(10, 0))
         ttk.Button(button_frame, text="Edit Member", command=self.edit_member).pack(side='right')
         ttk.Button(button_frame, text="Print Statement", command=self.print_statement).pack(side='left')
-    
-    def create_personal_info_tab(self, notebook):
+
+    def _on_tab_changed(self, event):
+        """Build a lazily created tab the first time it is selected"""
+        selected = self.notebook.select()
+        pending = self._tab_builders.pop(selected, None)
+        if pending is not None:
+            builder, frame = pending
+            builder(frame)
+
+    def create_personal_info_tab(self, frame):
         """Create personal information tab"""
-        frame = ttk.Frame(notebook)
-        notebook.add(frame, text="Personal Info")
-        
-        # Scrollable frame
-        canvas = tk.Canvas(frame)
-        scrollbar = ttk.Scrollbar(frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        # Member info
-        info_frame = ttk.LabelFrame(scrollable_frame, text="Member Information", padding="10")
+        # The handful of static rows always fits the tab, so no
+        # Canvas/Scrollbar wrapper — that added three widgets and a
+        # scrollregion recompute on every dialog resize
+        info_frame = ttk.LabelFrame(frame, text="Member Information", padding="10")
         info_frame.pack(fill='x', padx=10, pady=10)
         
         member = self.member_data['member_info']
@@ -8853,26 +9531,33 @@ class MemberDetailsDialog:
             ("Last Updated:", member.get('updated_at', 'N/A'))
         ]
         
-        for i, (label, value) in enumerate(info_items):
-            ttk.Label(info_frame, text=label, font=('Arial', 9, 'bold')).grid(row=i, column=0, sticky='w', padx=(0, 10), pady=2)
-            ttk.Label(info_frame, text=str(value)).grid(row=i, column=1, sticky='w', pady=2)
-        
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        # One read-only Text renders all rows; a label pair per row would
+        # allocate 18 widgets (and destroy them on close) for static text
+        content = "\n".join(f"{label:<16} {value}" for label, value in info_items)
+        info_text = tk.Text(
+            info_frame,
+            height=len(info_items),
+            wrap='none',
+            relief='flat',
+            font=('Courier New', 10),
+            cursor='arrow'
+        )
+        info_text.insert('1.0', content)
+        info_text.configure(state='disabled')
+        info_text.pack(fill='x')
     
-    def create_contributions_tab(self, notebook):
+    def create_contributions_tab(self, frame):
         """Create contributions tab"""
-        frame = ttk.Frame(notebook)
-        notebook.add(frame, text="Contributions")
-        
+        self._ensure_history()
+
         # Summary frame
         summary_frame = ttk.LabelFrame(frame, text="Contribution Summary", padding="10")
         summary_frame.pack(fill='x', padx=10, pady=10)
-        
+
         contributions = self.member_data.get('contributions', [])
-        total_contributions = sum(float(c.get('amount', 0)) for c in contributions)
-        
-        ttk.Label(summary_frame, text=f"Total Contributions: MWK {total_contributions:,.2f}", 
+        total_contributions = self._totals()[0]
+
+        ttk.Label(summary_frame, text=f"Total Contributions: MWK {total_contributions:,.2f}",
                  font=('Arial', 10, 'bold')).pack(anchor='w')
         ttk.Label(summary_frame, text=f"Number of Contributions: {len(contributions)}").pack(anchor='w')
         
@@ -8888,16 +9573,27 @@ class MemberDetailsDialog:
             contrib_tree.heading(col, text=col)
             contrib_tree.column(col, width=100)
         
-        # Add contributions to tree
-        for contrib in contributions:
-            contrib_tree.insert('', 'end', values=(
-                contrib.get('contribution_date', ''),
-                contrib.get('month', ''),
-                contrib.get('year', ''),
-                f"MWK {float(contrib.get('amount', 0)):,.2f}",
-                f"MWK {float(contrib.get('late_fee', 0)):,.2f}"
-            ))
-        
+        # Pre-format all rows, then insert in slices of 50 per event-loop
+        # tick so a member with years of history doesn't freeze the
+        # dialog while the tab builds
+        rows = [(
+            contrib.get('contribution_date', ''),
+            contrib.get('month', ''),
+            contrib.get('year', ''),
+            contrib['_amount_str'],
+            contrib['_late_fee_str']
+        ) for contrib in contributions]
+
+        def _insert_chunk(start=0):
+            if not contrib_tree.winfo_exists():
+                return
+            for row in rows[start:start + 50]:
+                contrib_tree.insert('', 'end', values=row)
+            if start + 50 < len(rows):
+                self.dialog.after(1, _insert_chunk, start + 50)
+
+        _insert_chunk()
+
         contrib_tree.pack(fill='both', expand=True)
         
         # Scrollbar for contributions
@@ -8905,20 +9601,18 @@ class MemberDetailsDialog:
         contrib_tree.configure(yscrollcommand=contrib_scrollbar.set)
         contrib_scrollbar.pack(side='right', fill='y')
     
-    def create_loans_tab(self, notebook):
+    def create_loans_tab(self, frame):
         """Create loans tab"""
-        frame = ttk.Frame(notebook)
-        notebook.add(frame, text="Loans")
-        
+        self._ensure_history()
+
         # Summary frame
         summary_frame = ttk.LabelFrame(frame, text="Loan Summary", padding="10")
         summary_frame.pack(fill='x', padx=10, pady=10)
-        
+
         loans = self.member_data.get('loans', [])
-        total_loans = sum(float(l.get('loan_amount', 0)) for l in loans)
-        total_outstanding = sum(float(l.get('outstanding_balance', 0)) for l in loans)
-        
-        ttk.Label(summary_frame, text=f"Total Loans Taken: MWK {total_loans:,.2f}", 
+        _, total_loans, total_outstanding = self._totals()
+
+        ttk.Label(summary_frame, text=f"Total Loans Taken: MWK {total_loans:,.2f}",
                  font=('Arial', 10, 'bold')).pack(anchor='w')
         ttk.Label(summary_frame, text=f"Outstanding Balance: MWK {total_outstanding:,.2f}", 
                  font=('Arial', 10, 'bold')).pack(anchor='w')
@@ -8936,19 +9630,21 @@ class MemberDetailsDialog:
             loans_tree.heading(col, text=col)
             loans_tree.column(col, width=120)
         
-        # Add loans to tree
+        # Same bulk pattern as the contributions tab: format first,
+        # insert into the not-yet-packed tree
+        rows = []
         for loan in loans:
-            outstanding = float(loan.get('outstanding_balance', 0))
-            status = 'Paid' if outstanding <= 0 else 'Active'
-            
-            loans_tree.insert('', 'end', values=(
+            outstanding = loan['_outstanding']
+            rows.append((
                 loan.get('loan_date', ''),
-                f"MWK {float(loan.get('loan_amount', 0)):,.2f}",
-                f"{float(loan.get('interest_rate', 0)):.1f}%",
-                f"MWK {outstanding:,.2f}",
-                status
+                _fmt_mwk(loan['_amount']),
+                _fmt_pct(loan['_rate']),
+                _fmt_mwk(outstanding),
+                'Paid' if outstanding <= 0 else 'Active'
             ))
-        
+        for row in rows:
+            loans_tree.insert('', 'end', values=row)
+
         loans_tree.pack(fill='both', expand=True)
         
         # Scrollbar for loans
@@ -8956,23 +9652,16 @@ class MemberDetailsDialog:
         loans_tree.configure(yscrollcommand=loans_scrollbar.set)
         loans_scrollbar.pack(side='right', fill='y')
     
-    def create_summary_tab(self, notebook):
+    def create_summary_tab(self, frame):
         """Create summary tab"""
-        frame = ttk.Frame(notebook)
-        notebook.add(frame, text="Summary")
-        
+        self._ensure_history()
+
         # Financial summary
         summary_frame = ttk.LabelFrame(frame, text="Financial Summary", padding="15")
         summary_frame.pack(fill='x', padx=10, pady=10)
         
-        # Calculate totals
-        contributions = self.member_data.get('contributions', [])
-        loans = self.member_data.get('loans', [])
-        
-        total_contributions = sum(float(c.get('amount', 0)) for c in contributions)
-        total_loans = sum(float(l.get('loan_amount', 0)) for l in loans)
-        total_outstanding = sum(float(l.get('outstanding_balance', 0)) for l in loans)
-        
+        total_contributions, total_loans, total_outstanding = self._totals()
+
         # Display summary
         summary_items = [
             ("Total Contributions:", f"MWK {total_contributions:,.2f}"),
@@ -8991,18 +9680,9 @@ class MemberDetailsDialog:
         standing_frame = ttk.LabelFrame(frame, text="Member Standing", padding="15")
         standing_frame.pack(fill='x', padx=10, pady=(0, 10))
         
-        # Determine member standing
-        if total_outstanding > 0:
-            standing = "Borrower"
-            standing_color = "orange"
-        elif total_contributions > 0:
-            standing = "Good Standing"
-            standing_color = "green"
-        else:
-            standing = "New Member"
-            standing_color = "blue"
-        
-        ttk.Label(standing_frame, text=f"Status: {standing}", 
+        standing, standing_color = self._standing()
+
+        ttk.Label(standing_frame, text=f"Status: {standing}",
                  font=('Arial', 12, 'bold')).pack(anchor='w')
     
     def edit_member(self):
@@ -9015,13 +9695,35 @@ class MemberDetailsDialog:
             self.result = True
     
     def print_statement(self):
-        """Print member statement"""
+        """Assemble the member statement on a worker thread, then show it"""
+        # History load and string assembly both scale with the member's
+        # transaction count, so they run on the shared DB executor while
+        # the dialog keeps servicing events; the result is shown from an
+        # after() poll on the Tk thread
+        future = _db_executor.submit(self._build_statement)
+        self._check_statement_future(future)
+
+    def _check_statement_future(self, future):
+        """Poll the statement build and open the window when it is done"""
+        if not future.done():
+            self.dialog.after(50, self._check_statement_future, future)
+            return
         try:
-            # Generate member statement
-            member = self.member_data['member_info']
-            member_name = f"{member.get('name', '')} {member.get('surname', '')}"
-            
-            statement = f"""
+            statement = future.result()
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to generate statement: {ErrorHandler.get_user_friendly_message(e)}")
+            return
+        self._show_statement_window(statement)
+
+    def _build_statement(self):
+        """Build the statement text (no widget access; safe off-thread)"""
+        member = self.member_data['member_info']
+        member_name = f"{member.get('name', '')} {member.get('surname', '')}"
+
+        # Accumulate into a StringIO; += on a str copies the whole
+        # prefix each time, which is quadratic over long histories
+        buf = io.StringIO()
+        buf.write(f"""
 BANK MMUDZI - MEMBER STATEMENT
 {'='*50}
 
@@ -9032,52 +9734,47 @@ Statement Date: {datetime.now().strftime('%Y-%m-%d')}
 
 CONTRIBUTIONS:
 {'-'*30}
-"""
-            
-            contributions = self.member_data.get('contributions', [])
-            total_contributions = 0
-            
-            for contrib in contributions:
-                amount = float(contrib.get('amount', 0))
-                total_contributions += amount
-                statement += f"{contrib.get('contribution_date', ''):<12} {contrib.get('month', ''):<10} MWK {amount:>10,.2f}\n"
-            
-            statement += f"{'-'*30}\nTotal Contributions: MWK {total_contributions:,.2f}\n\n"
-            
-            statement += "LOANS:\n" + "-"*30 + "\n"
-            
-            loans = self.member_data.get('loans', [])
-            total_loans = 0
-            total_outstanding = 0
-            
-            for loan in loans:
-                amount = float(loan.get('loan_amount', 0))
-                outstanding = float(loan.get('outstanding_balance', 0))
-                total_loans += amount
-                total_outstanding += outstanding
-                
-                statement += f"{loan.get('loan_date', ''):<12} MWK {amount:>10,.2f} Outstanding: MWK {outstanding:>10,.2f}\n"
-            
-            statement += f"{'-'*30}\nTotal Loans: MWK {total_loans:,.2f}\n"
-            statement += f"Outstanding Balance: MWK {total_outstanding:,.2f}\n\n"
-            statement += f"Net Position: MWK {total_contributions - total_outstanding:,.2f}\n"
-            
-            # Show statement in a new window
-            statement_window = tk.Toplevel(self.dialog)
-            statement_window.title(f"Statement - {member_name}")
-            statement_window.geometry("600x500")
-            
-            text_widget = tk.Text(statement_window, wrap='word', font=('Courier', 10))
-            text_widget.pack(fill='both', expand=True, padx=10, pady=10)
-            text_widget.insert('1.0', statement)
-            text_widget.config(state='disabled')
-            
-            # Print button
-            ttk.Button(statement_window, text="Close", 
-                      command=statement_window.destroy).pack(pady=10)
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to generate statement: {ErrorHandler.get_user_friendly_message(e)}")
+""")
+
+        self._ensure_history()
+        total_contributions, total_loans, total_outstanding = self._totals()
+
+        for contrib in self.member_data.get('contributions', []):
+            buf.write(f"{contrib.get('contribution_date', ''):<12} {contrib.get('month', ''):<10} MWK {contrib['_amount']:>10,.2f}\n")
+
+        buf.write(f"{'-'*30}\nTotal Contributions: MWK {total_contributions:,.2f}\n\n")
+
+        buf.write("LOANS:\n" + "-"*30 + "\n")
+
+        for loan in self.member_data.get('loans', []):
+            buf.write(f"{loan.get('loan_date', ''):<12} MWK {loan['_amount']:>10,.2f} Outstanding: MWK {loan['_outstanding']:>10,.2f}\n")
+
+        buf.write(f"{'-'*30}\nTotal Loans: MWK {total_loans:,.2f}\n")
+        buf.write(f"Outstanding Balance: MWK {total_outstanding:,.2f}\n\n")
+        buf.write(f"Net Position: MWK {total_contributions - total_outstanding:,.2f}\n")
+        return buf.getvalue()
+
+    def _show_statement_window(self, statement):
+        """Show a built statement in a new window"""
+        member = self.member_data['member_info']
+        member_name = f"{member.get('name', '')} {member.get('surname', '')}"
+
+        statement_window = tk.Toplevel(self.dialog)
+        statement_window.title(f"Statement - {member_name}")
+        statement_window.geometry("600x500")
+
+        # The statement is read-only, so skip the undo stack — Tk would
+        # otherwise record the large insert as undoable operations
+        text_widget = tk.Text(statement_window, wrap='word', font=('Courier', 10),
+                              undo=False, maxundo=0)
+        text_widget.pack(fill='both', expand=True, padx=10, pady=10)
+        text_widget.insert('1.0', statement)
+        text_widget.edit_modified(False)
+        text_widget.config(state='disabled')
+
+        # Print button
+        ttk.Button(statement_window, text="Close",
+                  command=statement_window.destroy).pack(pady=10)
     
     def close_dialog(self):
         """Close dialog"""
@@ -9096,7 +9793,7 @@ class EditMemberDialog:
         
         # Load member data
         try:
-            member_profile = get_member_profile(member_id)
+            member_profile = get_member_profile_cached(member_id)
             self.member_data = member_profile['member_info']
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load member data: {ErrorHandler.get_user_friendly_message(e)}")
@@ -9243,7 +9940,20 @@ class App(tk.Tk):
         
         # UI State
         self.current_panel = "dashboard"
+        self._active_panel = None
         self.sidebar_collapsed = False
+
+        # Dashboard query cache (30-second TTL, invalidated by writes)
+        self._dashboard_cache = None
+        self._dashboard_cache_time = 0.0
+        self._dashboard_cache_version = -1
+
+        # Built panel frames, keyed by panel id (see show_panel)
+        self._panels = {}
+
+        # Warm the dashboard query while Tk builds the widget tree; the
+        # first create_dashboard_panel consumes this future
+        self._dashboard_future = _db_executor.submit(self.get_dashboard_data)
         
         # Colors and styling
         self.colors = {
@@ -9264,6 +9974,22 @@ class App(tk.Tk):
         """Setup the modern admin panel UI with sidebar navigation"""
         self.geometry("1400x900")
         self.configure(bg=self.colors['light'])
+
+        # Shared font objects: Tk re-resolves an inline ('Arial', ...)
+        # tuple for every widget it is passed to, so the recurring sizes
+        # are created once here and reused across the whole panel UI
+        self.fonts = {
+            'title': tkfont.Font(family='Arial', size=24, weight='bold'),
+            'icon': tkfont.Font(family='Arial', size=24),
+            'card_value': tkfont.Font(family='Arial', size=18, weight='bold'),
+            'heading': tkfont.Font(family='Arial', size=16, weight='bold'),
+            'subheading': tkfont.Font(family='Arial', size=12, weight='bold'),
+            'button': tkfont.Font(family='Arial', size=12),
+            'label_bold': tkfont.Font(family='Arial', size=11, weight='bold'),
+            'body': tkfont.Font(family='Arial', size=10),
+            'body_bold': tkfont.Font(family='Arial', size=10, weight='bold'),
+            'small': tkfont.Font(family='Arial', size=9)
+        }
         
         # Create main container
         self.main_container = tk.Frame(self, bg=self.colors['light'])
@@ -9302,28 +10028,28 @@ class App(tk.Tk):
         header_frame.pack(fill='x', pady=(10, 20))
         header_frame.pack_propagate(False)
         
-        # Logo/Title
-        if not self.sidebar_collapsed:
-            title_label = tk.Label(
-                header_frame,
-                text="Bank Mmudzi",
-                font=('Arial', 16, 'bold'),
-                fg=self.colors['white'],
-                bg=self.colors['primary']
-            )
-            title_label.pack(pady=20)
-        
         # Collapse/Expand button
-        collapse_btn = tk.Button(
+        self.collapse_btn = tk.Button(
             header_frame,
             text="☰" if self.sidebar_collapsed else "◀",
-            font=('Arial', 12),
+            font=self.fonts['button'],
             bg=self.colors['secondary'],
             fg=self.colors['white'],
             border=0,
             command=self.toggle_sidebar
         )
-        collapse_btn.pack(side='right', padx=10)
+        self.collapse_btn.pack(side='right', padx=10)
+
+        # Logo/Title (kept around so toggling only packs/unpacks it)
+        self.title_label = tk.Label(
+            header_frame,
+            text="Bank Mmudzi",
+            font=self.fonts['heading'],
+            fg=self.colors['white'],
+            bg=self.colors['primary']
+        )
+        if not self.sidebar_collapsed:
+            self.title_label.pack(pady=20)
         
         # Navigation menu
         self.create_navigation_menu()
@@ -9342,15 +10068,17 @@ class App(tk.Tk):
         ]
         
         self.nav_buttons = {}
-        
+        self._nav_labels = {}
+
         for icon, text, panel_id in menu_items:
+            self._nav_labels[panel_id] = (icon, text)
             btn_frame = tk.Frame(self.sidebar, bg=self.colors['primary'])
             btn_frame.pack(fill='x', padx=5, pady=2)
             
             btn = tk.Button(
                 btn_frame,
                 text=f"{icon} {text}" if not self.sidebar_collapsed else icon,
-                font=('Arial', 10, 'bold'),
+                font=self.fonts['body_bold'],
                 bg=self.colors['secondary'],
                 fg=self.colors['white'],
                 activebackground=self.colors['accent'],
@@ -9367,10 +10095,20 @@ class App(tk.Tk):
             self.nav_buttons[panel_id] = btn
     
     def toggle_sidebar(self):
-        """Toggle sidebar collapse/expand"""
+        """Toggle sidebar collapse/expand by reconfiguring in place"""
         self.sidebar_collapsed = not self.sidebar_collapsed
-        self.sidebar.destroy()
-        self.create_sidebar()
+        self.sidebar.configure(width=60 if self.sidebar_collapsed else 250)
+
+        if self.sidebar_collapsed:
+            self.title_label.pack_forget()
+            self.collapse_btn.configure(text="☰")
+        else:
+            self.title_label.pack(pady=20)
+            self.collapse_btn.configure(text="◀")
+
+        for panel_id, btn in self.nav_buttons.items():
+            icon, text = self._nav_labels[panel_id]
+            btn.configure(text=icon if self.sidebar_collapsed else f"{icon} {text}")
     
     def create_main_content_area(self):
         """Create the main content area"""
@@ -9390,7 +10128,7 @@ class App(tk.Tk):
         self.page_title = tk.Label(
             self.content_header,
             text="Dashboard",
-            font=('Arial', 24, 'bold'),
+            font=self.fonts['title'],
             fg=self.colors['dark'],
             bg=self.colors['white']
         )
@@ -9403,7 +10141,7 @@ class App(tk.Tk):
         user_label = tk.Label(
             user_frame,
             text=f"Welcome, {getattr(self.session_manager, 'current_user', 'Admin')}",
-            font=('Arial', 10),
+            font=self.fonts['body'],
             fg=self.colors['dark'],
             bg=self.colors['white']
         )
@@ -9412,7 +10150,7 @@ class App(tk.Tk):
         logout_btn = tk.Button(
             user_frame,
             text="Logout",
-            font=('Arial', 10),
+            font=self.fonts['body'],
             bg=self.colors['danger'],
             fg=self.colors['white'],
             border=0,
@@ -9428,17 +10166,19 @@ class App(tk.Tk):
     
     def show_panel(self, panel_id):
         """Show the specified panel"""
-        # Update active button
-        for btn_id, btn in self.nav_buttons.items():
-            if btn_id == panel_id:
-                btn.configure(bg=self.colors['accent'])
-            else:
-                btn.configure(bg=self.colors['secondary'])
-        
-        # Clear main panel
-        for widget in self.main_panel.winfo_children():
-            widget.destroy()
-        
+        # Update active button: only the previously-active and the newly
+        # selected buttons need reconfiguring
+        if self._active_panel != panel_id:
+            if self._active_panel in self.nav_buttons:
+                self.nav_buttons[self._active_panel].configure(bg=self.colors['secondary'])
+            if panel_id in self.nav_buttons:
+                self.nav_buttons[panel_id].configure(bg=self.colors['accent'])
+            self._active_panel = panel_id
+        
+        # Hide whichever panel frame is currently showing
+        for frame in self._panels.values():
+            frame.pack_forget()
+
         # Update page title
         panel_titles = {
             "dashboard": "Dashboard",
@@ -9454,27 +10194,54 @@ class App(tk.Tk):
         self.page_title.configure(text=panel_titles.get(panel_id, "Dashboard"))
         self.current_panel = panel_id
         
-        # Show appropriate panel
-        if panel_id == "dashboard":
-            self.create_dashboard_panel()
-        elif panel_id == "members":
-            self.create_members_panel()
-        elif panel_id == "contributions":
-            self.create_contributions_panel()
-        elif panel_id == "loans":
-            self.create_loans_panel()
-        elif panel_id == "repayments":
-            self.create_repayments_panel()
-        elif panel_id == "reports":
-            self.create_reports_panel()
-        elif panel_id == "settings":
-            self.create_settings_panel()
-        elif panel_id == "audit":
-            self.create_audit_panel()
-        
+        # Show the cached panel frame, building it on first visit. The
+        # builder attribute is resolved lazily so that, like the old
+        # elif chain, only the branch actually taken has to exist
+        builder_names = {
+            "dashboard": "create_dashboard_panel",
+            "members": "create_members_panel",
+            "contributions": "create_contributions_panel",
+            "loans": "create_loans_panel",
+            "repayments": "create_repayments_panel",
+            "reports": "create_reports_panel",
+            "settings": "create_settings_panel",
+            "audit": "create_audit_panel"
+        }
+
+        frame = self._panels.get(panel_id)
+        if frame is None:
+            builder = getattr(self, builder_names.get(panel_id, ''), None)
+            if builder is not None:
+                frame = tk.Frame(self.main_panel, bg=self.colors['white'])
+                # Builders pack into self.main_panel; point it at the
+                # panel's own frame while building so the result is
+                # cacheable
+                outer_panel = self.main_panel
+                self.main_panel = frame
+                try:
+                    builder()
+                finally:
+                    self.main_panel = outer_panel
+                self._panels[panel_id] = frame
+
+        if frame is not None:
+            frame.pack(fill='both', expand=True)
+
         # Update session activity
         if hasattr(self, 'session_manager'):
             self.session_manager.update_activity()
+
+    def invalidate_panel(self, panel_id):
+        """Drop a cached panel so the next visit rebuilds it from fresh data"""
+        frame = self._panels.pop(panel_id, None)
+        if frame is not None:
+            frame.destroy()
+        if panel_id == "dashboard":
+            self._dashboard_cache = None
+        # If the invalidated panel is the one on screen, rebuild it right
+        # away so the user never looks at a blank main area
+        if self.current_panel == panel_id:
+            self.show_panel(panel_id)
     
     def create_dashboard_panel(self):
         """Create the dashboard overview panel"""
@@ -9482,15 +10249,20 @@ class App(tk.Tk):
         cards_frame = tk.Frame(self.main_panel, bg=self.colors['white'])
         cards_frame.pack(fill='x', pady=(0, 20))
         
-        # Get dashboard data
-        dashboard_data = self.get_dashboard_data()
+        # Get dashboard data, joining the startup preload if it is still
+        # pending; later rebuilds take the synchronous (cached) path
+        if self._dashboard_future is not None:
+            dashboard_data = self._dashboard_future.result()
+            self._dashboard_future = None
+        else:
+            dashboard_data = self.get_dashboard_data()
         
         # Create summary cards
         cards = [
             ("Total Members", dashboard_data['total_members'], self.colors['primary'], "👥"),
             ("Active Loans", dashboard_data['active_loans'], self.colors['warning'], "🏦"),
-            ("Monthly Contributions", f"MWK {dashboard_data['monthly_contributions']:,.2f}", self.colors['success'], "💰"),
-            ("Available Funds", f"MWK {dashboard_data['available_funds']:,.2f}", self.colors['accent'], "💳")
+            ("Monthly Contributions", _fmt_mwk(dashboard_data['monthly_contributions']), self.colors['success'], "💰"),
+            ("Available Funds", _fmt_mwk(dashboard_data['available_funds']), self.colors['accent'], "💳")
         ]
         
         for i, (title, value, color, icon) in enumerate(cards):
@@ -9510,7 +10282,7 @@ class App(tk.Tk):
         actions_frame = tk.LabelFrame(
             content_frame, 
             text="Quick Actions", 
-            font=('Arial', 12, 'bold'),
+            font=self.fonts['subheading'],
             bg=self.colors['white'],
             fg=self.colors['dark']
         )
@@ -9529,7 +10301,7 @@ class App(tk.Tk):
             btn = tk.Button(
                 actions_frame,
                 text=action_text,
-                font=('Arial', 10),
+                font=self.fonts['body'],
                 bg=self.colors['accent'],
                 fg=self.colors['white'],
                 border=0,
@@ -9543,7 +10315,7 @@ class App(tk.Tk):
         activity_frame = tk.LabelFrame(
             content_frame, 
             text="Recent Activity", 
-            font=('Arial', 12, 'bold'),
+            font=self.fonts['subheading'],
             bg=self.colors['white'],
             fg=self.colors['dark']
         )
@@ -9552,16 +10324,30 @@ class App(tk.Tk):
         # Recent activity list
         activity_list = tk.Listbox(
             activity_frame,
-            font=('Arial', 9),
+            font=self.fonts['small'],
             bg=self.colors['light'],
             selectbackground=self.colors['accent']
         )
         activity_list.pack(fill='both', expand=True, padx=10, pady=10)
         
-        # Load recent activity
+        # Load the first page; further pages are fetched lazily when the
+        # list is scrolled to the bottom
         recent_activities = self.get_recent_activities()
         for activity in recent_activities:
             activity_list.insert(tk.END, activity)
+        self._activity_offset = len(recent_activities)
+
+        def _on_activity_scroll(first, last):
+            if float(last) >= 1.0 and self._activity_offset is not None:
+                more = self.get_recent_activities(offset=self._activity_offset)
+                if more:
+                    self._activity_offset += len(more)
+                    for activity in more:
+                        activity_list.insert(tk.END, activity)
+                else:
+                    self._activity_offset = None
+
+        activity_list.configure(yscrollcommand=_on_activity_scroll)
         
         # Add developer info section at the bottom of dashboard
         dev_info_frame = tk.Frame(self.main_panel, bg=self.colors['light'], relief='solid', bd=1)
@@ -9571,7 +10357,7 @@ class App(tk.Tk):
         dev_header = tk.Label(
             dev_info_frame,
             text="💻 System Developer",
-            font=('Arial', 11, 'bold'),
+            font=self.fonts['label_bold'],
             bg=self.colors['light'],
             fg=self.colors['primary']
         )
@@ -9581,7 +10367,7 @@ class App(tk.Tk):
         dev_details = tk.Label(
             dev_info_frame,
             text="Nehemiah Nganjo | Phone: 0997082156 | GitHub: github.com/Nehemiahnganjo",
-            font=('Arial', 10),
+            font=self.fonts['body'],
             bg=self.colors['light'],
             fg=self.colors['dark'],
             cursor="hand2"
@@ -9603,7 +10389,7 @@ class App(tk.Tk):
         icon_label = tk.Label(
             card,
             text=icon,
-            font=('Arial', 24),
+            font=self.fonts['icon'],
             bg=color,
             fg=self.colors['white']
         )
@@ -9613,7 +10399,7 @@ class App(tk.Tk):
         value_label = tk.Label(
             card,
             text=str(value),
-            font=('Arial', 18, 'bold'),
+            font=self.fonts['card_value'],
             bg=color,
             fg=self.colors['white']
         )
@@ -9623,7 +10409,7 @@ class App(tk.Tk):
         title_label = tk.Label(
             card,
             text=title,
-            font=('Arial', 10),
+            font=self.fonts['body'],
             bg=color,
             fg=self.colors['white']
         )
@@ -9632,54 +10418,39 @@ class App(tk.Tk):
         return card
     
     def get_dashboard_data(self):
-        """Get data for dashboard summary cards"""
+        """Get data for dashboard summary cards (cached for 30 seconds)"""
+        now = time.monotonic()
+        if (self._dashboard_cache is not None
+                and self._dashboard_cache_version == _dashboard_data_version
+                and now - self._dashboard_cache_time < 30):
+            return self._dashboard_cache
         try:
             conn = connect_db()
             cursor = conn.cursor()
-            
-            # Total members
-            cursor.execute("SELECT COUNT(*) FROM Members WHERE status = 'active'")
-            total_members = cursor.fetchone()[0]
-            
-            # Active loans
-            cursor.execute("SELECT COUNT(*) FROM Loans WHERE outstanding_balance > 0")
-            active_loans = cursor.fetchone()[0]
-            
-            # Monthly contributions (current month)
-            current_month = datetime.now().month
-            current_year = datetime.now().year
-            
-            # Use database-specific syntax
-            if db_manager.current_db_type == 'mysql':
-                cursor.execute("""
-                    SELECT COALESCE(SUM(amount), 0) FROM Contributions 
-                    WHERE month = %s AND year = %s
-                """, (current_month, current_year))
-            else:
-                cursor.execute("""
-                    SELECT COALESCE(SUM(amount), 0) FROM Contributions 
-                    WHERE month = ? AND year = ?
-                """, (current_month, current_year))
-            monthly_contributions = cursor.fetchone()[0]
-            
-            # Available funds
-            cursor.execute("SELECT COALESCE(SUM(amount), 0) FROM Contributions")
-            total_contributions = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT COALESCE(SUM(outstanding_balance), 0) FROM Loans")
-            outstanding_loans = cursor.fetchone()[0]
-            
+
+            # Monthly contributions use the current month
+            now_dt = datetime.now()
+            current_month, current_year = now_dt.month, now_dt.year
+
+            # Single round-trip: every summary card value as a scalar subquery
+            cursor.execute(_sql(_SQL_DASHBOARD_SUMMARY), (current_month, current_year))
+            (total_members, active_loans, monthly_contributions,
+             total_contributions, outstanding_loans) = cursor.fetchone()
+
             available_funds = total_contributions - outstanding_loans
             
             conn.close()
-            
-            return {
+
+            self._dashboard_cache = {
                 'total_members': total_members,
                 'active_loans': active_loans,
                 'monthly_contributions': monthly_contributions,
                 'available_funds': available_funds
             }
-            
+            self._dashboard_cache_time = now
+            self._dashboard_cache_version = _dashboard_data_version
+            return self._dashboard_cache
+
         except Exception as e:
             logger.error(f"Error getting dashboard data: {str(e)}")
             return {
@@ -9689,33 +10460,21 @@ class App(tk.Tk):
                 'available_funds': 0
             }
     
-    def get_recent_activities(self):
-        """Get recent activities for dashboard"""
+    def get_recent_activities(self, offset=0, limit=50):
+        """Get a page of recent activities for the dashboard"""
         try:
             conn = connect_db()
             cursor = conn.cursor()
-            
-            cursor.execute("""
-                SELECT operation, table_name, old_values, timestamp
-                FROM AuditLog 
-                ORDER BY timestamp DESC 
-                LIMIT 10
-            """)
-            
-            activities = []
-            for row in cursor.fetchall():
-                operation, table_name, old_values, timestamp = row
-                activity_text = f"{timestamp}: {operation} on {table_name}"
-                if old_values:
-                    activity_text += f" - {old_values[:50]}..."
-                activities.append(activity_text)
-            
+
+            cursor.execute(_sql(_SQL_RECENT_ACTIVITIES), (limit, offset))
+
+            activities = [row[0] for row in cursor.fetchall()]
             conn.close()
             return activities
             
         except Exception as e:
             logger.error(f"Error getting recent activities: {str(e)}")
-            return ["No recent activities available"]
+            return ["No recent activities available"] if offset == 0 else []
     
     def calculate_year_dividends(self):
         """Calculate dividends for current year"""
@@ -9758,7 +10517,7 @@ class App(tk.Tk):
         dev_name = tk.Label(
             dev_frame,
             text="Developer: Nehemiah Nganjo",
-            font=('Arial', 10, 'bold'),
+            font=self.fonts['body_bold'],
             fg=self.colors['white'],
             bg=self.colors['primary']
         )
@@ -9767,7 +10526,7 @@ class App(tk.Tk):
         contact_info = tk.Label(
             dev_frame,
             text="Phone: 0997082156 | GitHub: Nehemiahnganjo",
-            font=('Arial', 9),
+            font=self.fonts['small'],
             fg=self.colors['light'],
             bg=self.colors['primary'],
             cursor="hand2"
@@ -9788,7 +10547,7 @@ class App(tk.Tk):
         version_info = tk.Label(
             version_frame,
             text="Bank Mmudzi v1.4.0",
-            font=('Arial', 10, 'bold'),
+            font=self.fonts['body_bold'],
             fg=self.colors['white'],
             bg=self.colors['primary']
         )
@@ -9797,7 +10556,7 @@ class App(tk.Tk):
         copyright_info = tk.Label(
             version_frame,
             text="© 2024 Community Banking System",
-            font=('Arial', 9),
+            font=self.fonts['small'],
             fg=self.colors['light'],
             bg=self.colors['primary']
         )
@@ -9855,6 +10614,14 @@ class EnhancedMemberPanel:
         self.status_filter = "All"
         self.contribution_filter = "All"
         self.loan_filter = "All"
+
+        # Pagination: the tree holds one page of rows at a time so the
+        # refresh cost stays constant regardless of club size
+        self.page_size = 100
+        self.current_page = 0
+        self._count_cache = {}  # (search, status) -> total matching rows
+        self._total_members = 0
+        self._refresh_generation = 0
         
         # UI components (will be created in setup_panel)
         self.main_frame = None
@@ -9985,7 +10752,7 @@ class EnhancedMemberPanel:
             padx=20,
             pady=8,
             cursor='hand2',
-            command=self.refresh_member_list
+            command=self.force_refresh
         )
         self.refresh_btn.pack(side='right')
         
@@ -10278,6 +11045,43 @@ class EnhancedMemberPanel:
             anchor='e'
         )
         self.selection_label.pack(side='right', padx=10, pady=5)
+
+        # Page navigation
+        self.next_page_btn = tk.Button(
+            self.status_bar,
+            text="Next ▶",
+            font=('Arial', 9),
+            bg=self.colors['secondary'],
+            fg=self.colors['white'],
+            relief='flat',
+            cursor='hand2',
+            command=self.next_page
+        )
+        self.next_page_btn.pack(side='right', padx=(0, 10), pady=3)
+
+        self.prev_page_btn = tk.Button(
+            self.status_bar,
+            text="◀ Prev",
+            font=('Arial', 9),
+            bg=self.colors['secondary'],
+            fg=self.colors['white'],
+            relief='flat',
+            cursor='hand2',
+            command=self.prev_page
+        )
+        self.prev_page_btn.pack(side='right', padx=(0, 5), pady=3)
+
+    def next_page(self):
+        """Show the next page of members"""
+        if (self.current_page + 1) * self.page_size < self._total_members:
+            self.current_page += 1
+            self.refresh_member_list()
+
+    def prev_page(self):
+        """Show the previous page of members"""
+        if self.current_page > 0:
+            self.current_page -= 1
+            self.refresh_member_list()
     
     def setup_keyboard_bindings(self):
         """Setup keyboard shortcuts for accessibility"""
@@ -10290,7 +11094,7 @@ class EnhancedMemberPanel:
         self.main_frame.bind('<Alt-D>', lambda e: self.delete_member_action())
         self.main_frame.bind('<Alt-v>', lambda e: self.view_member_action())
         self.main_frame.bind('<Alt-V>', lambda e: self.view_member_action())
-        self.main_frame.bind('<F5>', lambda e: self.refresh_member_list())
+        self.main_frame.bind('<F5>', lambda e: self.force_refresh())
         self.main_frame.bind('<Control-f>', lambda e: self.focus_search())
         self.main_frame.bind('<Control-F>', lambda e: self.focus_search())
         
@@ -10326,35 +11130,63 @@ class EnhancedMemberPanel:
             self.app.show_member_details(self.selected_member_id)
     
     def refresh_member_list(self):
-        """Refresh the member list"""
+        """Refresh the member list without blocking the UI thread"""
+        # The query runs on the shared DB executor so a slow backend
+        # never freezes typing. A generation counter lets a newer
+        # refresh supersede an in-flight one: the stale result is
+        # dropped when it arrives
+        self._refresh_generation += 1
+        generation = self._refresh_generation
+        future = _db_executor.submit(self.get_filtered_members)
+        self._check_member_list_future(future, generation)
+
+    def _check_member_list_future(self, future, generation):
+        """Poll the member query and populate the tree when it is done"""
+        if generation != self._refresh_generation:
+            return
+        if not future.done():
+            self.main_frame.after(50, self._check_member_list_future, future, generation)
+            return
+        # get_filtered_members handles its own errors and returns []
+        self._populate_member_list(future.result())
+
+    def _populate_member_list(self, members):
+        """Fill the tree from fetched rows (Tk thread only)"""
         try:
             # Clear existing items
             for item in self.members_tree.get_children():
                 self.members_tree.delete(item)
-            
-            # Get filtered member data
-            members = self.get_filtered_members()
-            
-            # Populate the tree
-            for member in members:
-                # Format member data for display
-                values = (
-                    member.get('member_id', ''),
-                    member.get('member_number', ''),
-                    f"{member.get('name', '')} {member.get('surname', '')}".strip(),
-                    member.get('phone_number', ''),
-                    member.get('status', '').title(),
-                    '...'  # Actions column placeholder
+
+            # Populate the tree from the raw row tuples. The member_id
+            # doubles as the item iid, which keeps later lookups O(1)
+            # and avoids a second Tcl call per row just to stash the id
+            for member_id, member_number, name, surname, phone, status in members:
+                self.members_tree.insert(
+                    '', 'end',
+                    iid=str(member_id),
+                    values=(
+                        member_id,
+                        member_number or '',
+                        f"{name or ''} {surname or ''}".strip(),
+                        phone or '',
+                        (status or '').title(),
+                        '...'  # Actions column placeholder
+                    )
                 )
-                
-                # Insert with member_id as the item identifier
-                item_id = self.members_tree.insert('', 'end', values=values)
-                # Store member_id in the item for later reference
-                self.members_tree.set(item_id, '#0', member.get('member_id', ''))
             
-            # Update status
-            member_count = len(members)
-            self.update_status(f"Ready - {member_count} members shown")
+            # Update status and pager
+            if self._total_members:
+                start = self.current_page * self.page_size + 1
+                end = start + len(members) - 1
+                self.update_status(f"Ready - showing {start}-{end} of {self._total_members} members")
+            else:
+                self.update_status("Ready - 0 members shown")
+
+            if hasattr(self, 'prev_page_btn'):
+                self.prev_page_btn.configure(
+                    state='normal' if self.current_page > 0 else 'disabled')
+                has_next = (self.current_page + 1) * self.page_size < self._total_members
+                self.next_page_btn.configure(state='normal' if has_next else 'disabled')
             
         except Exception as e:
             logger.error(f"Error refreshing member list: {e}")
@@ -10365,45 +11197,52 @@ class EnhancedMemberPanel:
         try:
             conn = connect_db()
             cursor = conn.cursor()
-            
-            # Base query
-            query = """
-                SELECT member_id, member_number, name, surname, phone_number, status
-                FROM Members
-                WHERE 1=1
-            """
+
+            where = " WHERE 1=1"
             params = []
-            
-            # Apply search filter
-            if self.search_text.strip():
-                search_term = f"%{self.search_text.strip()}%"
-                query += " AND (name LIKE ? OR surname LIKE ? OR phone_number LIKE ? OR member_number LIKE ?)"
-                params.extend([search_term, search_term, search_term, search_term])
-            
+
+            # Apply search filter. With FTS5 present the term becomes a
+            # prefix-token MATCH against the index; otherwise fall back
+            # to the unindexed LIKE scan
+            search = self.search_text.strip()
+            if search:
+                tokens = re.findall(r'\w+', search)
+                if _member_fts_available and db_manager.current_db_type == 'sqlite' and tokens:
+                    where += """ AND member_id IN (
+                        SELECT rowid FROM Members_fts WHERE Members_fts MATCH ?)"""
+                    params.append(' '.join(f'"{t}"*' for t in tokens))
+                else:
+                    search_term = f"%{search}%"
+                    where += " AND (name LIKE ? OR surname LIKE ? OR phone_number LIKE ? OR member_number LIKE ?)"
+                    params.extend([search_term, search_term, search_term, search_term])
+
             # Apply status filter
             if self.status_filter != "All":
-                query += " AND status = ?"
+                where += " AND status = ?"
                 params.append(self.status_filter.lower())
-            
-            # Execute query
-            cursor.execute(query, params)
+
+            # Total count for the pager, cached per filter combination so
+            # page navigation doesn't recount
+            filter_key = (search, self.status_filter)
+            total = self._count_cache.get(filter_key)
+            if total is None:
+                cursor.execute("SELECT COUNT(*) FROM Members" + where, params)
+                total = cursor.fetchone()[0]
+                self._count_cache[filter_key] = total
+            self._total_members = total
+
+            # Fetch only the current page
+            query = ("SELECT member_id, member_number, name, surname, phone_number, status"
+                     " FROM Members" + where + " LIMIT ? OFFSET ?")
+            cursor.execute(query, params + [self.page_size, self.current_page * self.page_size])
             results = cursor.fetchall()
             conn.close()
-            
-            # Convert to list of dictionaries
-            members = []
-            for row in results:
-                members.append({
-                    'member_id': row[0],
-                    'member_number': row[1],
-                    'name': row[2],
-                    'surname': row[3],
-                    'phone_number': row[4],
-                    'status': row[5]
-                })
-            
-            return members
-            
+
+            # Raw (member_id, member_number, name, surname, phone,
+            # status) tuples, already in Treeview column order — no
+            # intermediate dict per row
+            return results
+
         except Exception as e:
             logger.error(f"Error getting filtered members: {e}")
             return []
@@ -10424,8 +11263,14 @@ class EnhancedMemberPanel:
         self.status_filter = self.status_filter_combo.get()
         self.contribution_filter = self.contribution_filter_combo.get()
         self.loan_filter = self.loan_filter_combo.get()
-        
-        # Refresh the list with new filters
+
+        # New filters start from the first page
+        self.current_page = 0
+        self.refresh_member_list()
+
+    def force_refresh(self):
+        """Reload from the database, dropping cached filter counts"""
+        self._count_cache.clear()
         self.refresh_member_list()
     
     def sort_by_column(self, column):
@@ -10833,11 +11678,17 @@ class EnhancedMemberPanel:
         # Clear and populate tree
         for item in self.members_tree.get_children():
             self.members_tree.delete(item)
-        
+
+        # Score the whole cohort in one batch pass instead of running a
+        # per-member standing query inside the loop
+        standings = {
+            s['member_id']: s['standing_category']
+            for s in self.member_analyzer.calculate_all_member_standings()
+        }
+
         for member in filtered_members:
-            standing_data = self.member_analyzer.calculate_member_standing(member['member_id'])
-            standing = standing_data.get('standing_category', 'Unknown') if standing_data.get('success') else 'Unknown'
-            
+            standing = standings.get(member['member_id'], 'Unknown')
+
             self.members_tree.insert('', 'end', values=(
                 member['member_id'],
                 member['member_number'],
@@ -10850,8 +11701,10 @@ class EnhancedMemberPanel:
             ))
     
     def refresh_members_list(self):
-        """Refresh the members list"""
-        self.apply_member_filter()
+        """Refresh the members list after a data change"""
+        # The row set just changed, so the cached pagination counts are
+        # stale too — force_refresh drops them before repopulating
+        self.force_refresh()
     
     def refresh_contributions_list(self):
         """Refresh the contributions list"""
@@ -10979,6 +11832,7 @@ class EnhancedMemberPanel:
         self.wait_window(dialog.dialog)
         if dialog.result:
             self.refresh_members_list()
+            self.app.invalidate_panel("dashboard")
     
     def show_member_details(self, event):
         """Show detailed member information dialog"""
@@ -10993,6 +11847,7 @@ class EnhancedMemberPanel:
         self.wait_window(dialog.dialog)
         if dialog.result:
             self.refresh_members_list()
+            self.app.invalidate_panel("dashboard")
     
     def record_contribution(self):
         """Record a new contribution"""
@@ -11049,9 +11904,8 @@ class EnhancedMemberPanel:
             if contribution_id:
                 messagebox.showinfo("Success", f"Contribution of MWK {amount:,.2f} recorded successfully for {member_name} ({month})")
                 self.clear_contribution_form()
-                # Refresh any relevant displays
-                if hasattr(self, 'refresh_dashboard'):
-                    self.refresh_dashboard()
+                # Drop the cached dashboard so the cards reflect this write
+                self.app.invalidate_panel("dashboard")
             else:
                 messagebox.showerror("Error", "Failed to record contribution")
                 
@@ -11142,9 +11996,8 @@ Do you want to process this loan?
                 if loan_id:
                     messagebox.showinfo("Success", f"Loan of MWK {loan_amount:,.2f} processed successfully for {member_name}")
                     self.clear_loan_form()
-                    # Refresh any relevant displays
-                    if hasattr(self, 'refresh_dashboard'):
-                        self.refresh_dashboard()
+                    # Drop the cached dashboard so the cards reflect this write
+                    self.app.invalidate_panel("dashboard")
                 else:
                     messagebox.showerror("Error", "Failed to process loan")
                 
@@ -12505,20 +13358,12 @@ def connect_db():
     
     if db_manager is None:
         db_manager = initialize_database_manager()
-    
-    try:
-        if hasattr(db_manager, 'current_db_type') and db_manager.current_db_type == 'mysql':
-            return mysql.connector.connect(**MYSQL_CONFIG)
-        else:
-            conn = sqlite3.connect(SQLITE_DB_NAME, timeout=30.0)
-            conn.execute('PRAGMA foreign_keys = ON')
-            return conn
-    except Exception as e:
-        logger.error(f"Database connection error: {e}")
-        # Fallback to SQLite
-        conn = sqlite3.connect(SQLITE_DB_NAME, timeout=30.0)
-        conn.execute('PRAGMA foreign_keys = ON')
-        return conn
+
+    # The manager keeps a long-lived connection per thread (WAL + tuned
+    # pragmas on SQLite) and handles the MySQL/SQLite fallback itself,
+    # so every caller shares the pooled connection instead of paying a
+    # fresh file-open and journal setup per query
+    return db_manager.get_connection()
 
 def initialize_db():
     """Initialize the database with proper schema"""
@@ -12625,6 +13470,14 @@ def initialize_db():
         
         conn.commit()
         conn.close()
+
+        # Supporting indexes and the member-search FTS index; safe to
+        # re-run (IF NOT EXISTS throughout) and a no-op on MySQL
+        try:
+            _create_performance_indexes()
+        except Exception as index_error:
+            logger.warning(f"Failed to create performance indexes: {index_error}")
+
         logger.info("Database initialized successfully")
         return True
     except Exception as e:
@@ -12658,6 +13511,8 @@ def create_member(name: str, surname: str, phone: str, email: str = '') -> int:
         member_id = cursor.lastrowid
         conn.commit()
         conn.close()
+        invalidate_member_profile_cache()
+        invalidate_dashboard_cache()
         logger.info(f"Member created: {name} {surname} (ID: {member_id})")
         return member_id
     except Exception as e:
@@ -12686,8 +13541,9 @@ def update_member(member_id: int, name: str, surname: str, phone: str, email: st
         success = cursor.rowcount > 0
         conn.commit()
         conn.close()
-        
+
         if success:
+            invalidate_member_profile_cache()
             logger.info(f"Member updated: {name} {surname} (ID: {member_id})")
         return success
     except Exception as e:
@@ -12725,6 +13581,7 @@ def create_contribution(member_id: int, month: str, amount: float, year: int = N
         contribution_id = cursor.lastrowid
         conn.commit()
         conn.close()
+        invalidate_dashboard_cache()
         logger.info(f"Contribution created: Member {member_id}, Amount {amount} (ID: {contribution_id})")
         return contribution_id
     except Exception as e:
@@ -12761,6 +13618,7 @@ def create_loan(member_id: int, loan_amount: float, interest_rate: float, months
         loan_id = cursor.lastrowid
         conn.commit()
         conn.close()
+        invalidate_dashboard_cache()
         logger.info(f"Loan created: Member {member_id}, Amount {loan_amount} (ID: {loan_id})")
         return loan_id
     except Exception as e:
@@ -12817,6 +13675,7 @@ def create_repayment(loan_id: int, repayment_amount: float) -> int:
         
         conn.commit()
         conn.close()
+        invalidate_dashboard_cache()
         logger.info(f"Repayment created: Loan {loan_id}, Amount {repayment_amount} (ID: {repayment_id})")
         return repayment_id
     except Exception as e:
@@ -12930,23 +13789,30 @@ def read_repayments() -> list:
         logger.error(f"Error reading repayments: {e}")
         return []
 
-def get_member_profile(member_id: int) -> dict:
-    """Get member profile with contributions and loans"""
+def get_member_profile(member_id: int, include_history: bool = True) -> dict:
+    """Get member profile with contributions and loans
+
+    Args:
+        member_id (int): Member ID
+        include_history (bool): Load contribution/loan history too;
+            callers that only need the basic row can skip it and fetch
+            history on demand later
+    """
     try:
         conn = connect_db()
         cursor = conn.cursor()
-        
+
         if hasattr(db_manager, 'current_db_type') and db_manager.current_db_type == 'mysql':
             cursor.execute('SELECT * FROM Members WHERE member_id = %s', (member_id,))
         else:
             cursor.execute('SELECT * FROM Members WHERE member_id = ?', (member_id,))
-        
+
         member_data = cursor.fetchone()
         conn.close()
-        
+
         if not member_data:
             return None
-        
+
         member_info = {
             'member_id': member_data[0],
             'member_number': member_data[1],
@@ -12957,10 +13823,10 @@ def get_member_profile(member_id: int) -> dict:
             'join_date': member_data[6],
             'status': member_data[7]
         }
-        
-        contributions = read_contributions_for_member(member_id)
+
+        contributions = read_contributions_for_member(member_id) if include_history else []
         loans = []  # Simplified for now
-        
+
         return {
             'member_info': member_info,
             'contributions': contributions,
@@ -12970,6 +13836,34 @@ def get_member_profile(member_id: int) -> dict:
         logger.error(f"Error getting member profile: {e}")
         return None
 
+# Version-keyed profile memo: dialogs that reopen the same member reuse
+# the fetched profile until a member mutation bumps the version, which
+# makes every cached entry stale at once
+_member_profile_version = 0
+
+def invalidate_member_profile_cache():
+    """Invalidate memoized member profiles after a member mutation"""
+    global _member_profile_version
+    _member_profile_version += 1
+
+@lru_cache(maxsize=256)
+def _cached_member_profile(member_id, version):
+    return get_member_profile(member_id)
+
+# Dashboard aggregates only change when money or membership moves. The
+# App instance pairs this version with its 30-second TTL so a write
+# shows up on the next refresh instead of waiting out the TTL
+_dashboard_data_version = 0
+
+def invalidate_dashboard_cache():
+    """Invalidate cached dashboard aggregates after a financial write"""
+    global _dashboard_data_version
+    _dashboard_data_version += 1
+
+def get_member_profile_cached(member_id: int) -> dict:
+    """Memoized get_member_profile; invalidated on member mutations"""
+    return _cached_member_profile(member_id, _member_profile_version)
+
 # Validation Engine
 class ValidationEngine:
     """Input validation engine"""
@@ -13095,6 +13989,10 @@ class BackupManager:
         try:
             if os.path.exists(backup_path):
                 import shutil
+                # Release the pooled per-thread connection so the database
+                # file is not swapped underneath an open WAL handle
+                if hasattr(db_manager, 'close_thread_connection'):
+                    db_manager.close_thread_connection()
                 shutil.copy2(backup_path, SQLITE_DB_NAME)
                 logger.info(f"Backup restored from: {backup_path}")
                 return True